@@ -9,6 +9,7 @@ setup(
     python_requires=">=3.11",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"worldbuilder.resources": ["help/*.html"]},
     install_requires=[
         "PyQt6>=6.6.0",
         "SQLAlchemy>=2.0.0",
@@ -21,6 +22,12 @@ setup(
             "pytest-qt>=4.2.0",
             "black>=23.0.0",
         ],
+        # Optional accelerators for the relationship graph; each falls back
+        # to a pure NumPy/NetworkX path when missing
+        "graph": [
+            "numba>=0.58.0",
+            "scipy>=1.10.0",
+        ],
     },
     entry_points={
         "console_scripts": [
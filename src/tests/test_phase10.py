@@ -5,24 +5,53 @@ Tests timeline visualization, relationship graphs, and custom calendar systems.
 
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
+import matplotlib.dates as mdates
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QThreadPool
+import os
+import subprocess
 import sys
 
 # Ensure QApplication exists
 if not QApplication.instance():
     app = QApplication(sys.argv)
 
+from worldbuilder.database import (
+    DatabaseManager, UniverseRepository, EventRepository, TimelineRepository
+)
+from worldbuilder.services import UniverseService, EventService, TimelineService
 from worldbuilder.widgets.timeline_widget import TimelineWidget, TimelineCanvas
 from worldbuilder.widgets.relationship_graph_widget import (
     RelationshipGraphWidget, RelationshipGraphCanvas
 )
+from worldbuilder.widgets._fr_layout import fr_layout
 from worldbuilder.utils.calendar_system import (
     CustomCalendar, DateCalculator, CalendarConverter,
     create_calendar_from_preset, PRESET_CALENDARS
 )
 
 
+def wait_for_refresh():
+    """Wait for timeline refresh workers and deliver their results."""
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
+
+def _create_timeline_db(db_manager):
+    """Create a universe with two events and a timeline; return the session."""
+    db_manager.create_tables()
+    session = db_manager.get_session()
+    universe = UniverseService(UniverseRepository(session)).create_universe(name="Arda")
+    event_service = EventService(EventRepository(session))
+    for name, sort_value in [("Second", 2), ("First", 1)]:
+        event_service.create_event(name=name, universe_id=universe.id,
+                                   date_sort_value=sort_value)
+    TimelineService(TimelineRepository(session)).create_timeline(
+        name="Main", universe_id=universe.id)
+    return session
+
+
 # Test Fixtures
 @pytest.fixture
 def sample_events():
@@ -133,6 +162,127 @@ class TestTimelineCanvas:
         canvas.set_zoom(0.01)
         assert canvas.zoom_level == 0.1  # Min zoom
     
+    def test_zoom_culls_events(self, sample_events):
+        """Test zooming in draws only the events inside the visible window."""
+        canvas = TimelineCanvas()
+        canvas.set_events(sample_events)
+        canvas.set_zoom(4.0)
+        canvas._do_render()
+        
+        assert [text.get_text().strip() for text in canvas.axes.texts] == ["Test Event 2"]
+        assert len(canvas.axes.collections[0].get_offsets()) == 1
+        
+        # Past the label limit one event per column of the x-range is labelled
+        canvas.LABEL_LIMIT = 3
+        canvas.set_zoom(1.0)
+        canvas._do_render()
+        labels = [text.get_text().strip() for text in canvas.axes.texts]
+        assert labels == ["Test Event 0", "Test Event 2", "Test Event 3"]
+        assert len(canvas.axes.collections[0].get_offsets()) == 5
+    
+    def test_event_colors_by_type_code(self, sample_events):
+        """Test event colors are gathered from one lookup per type."""
+        canvas = TimelineCanvas()
+        sample_events[0].type = 'Battle'
+        sample_events[1].type = 'unknown'
+        canvas.set_events(sample_events)
+        
+        assert len(canvas._color_lut) == 3
+        assert list(canvas._colors) == ['red', 'gray', 'blue', 'blue', 'blue']
+    
+    def test_calendar_counts_cached(self, sample_events):
+        """Test calendar month counts are reused until the events change."""
+        canvas = TimelineCanvas()
+        sample_events[1].exact_date = datetime(2020, 1, 15)
+        canvas.set_events(sample_events)
+        canvas.set_view_mode("calendar")
+        canvas._do_render()
+        
+        cached = canvas._calendar_cache
+        assert list(cached[2]) == [2, 1, 1, 1]
+        assert canvas.axes.patches[0].get_width() == 20  # Days wide
+        canvas._do_render()
+        assert canvas._calendar_cache is cached
+        
+        canvas.set_events(sample_events[:2])
+        assert canvas._calendar_cache is None
+    
+    def test_click_selects_closest_event(self, sample_events):
+        """Test clicking emits the event nearest the click date."""
+        canvas = TimelineCanvas()
+        canvas.set_events(list(reversed(sample_events)))
+        clicked = []
+        canvas.event_clicked.connect(clicked.append)
+        
+        x = mdates.date2num(datetime(2022, 3, 1))
+        canvas._on_click(Mock(inaxes=canvas.axes, xdata=x, ydata=0))
+        x = mdates.date2num(datetime(2023, 11, 1))
+        canvas._on_click(Mock(inaxes=canvas.axes, xdata=x, ydata=0))
+        x = mdates.date2num(datetime(2050, 1, 1))
+        canvas._on_click(Mock(inaxes=canvas.axes, xdata=x, ydata=0))
+        assert clicked == [sample_events[2], sample_events[4]]
+    
+    def test_date_formatter_reused(self, sample_events):
+        """Test every render shares one concise date formatter."""
+        canvas = TimelineCanvas()
+        canvas.set_events(sample_events)
+        canvas._do_render()
+        formatter = canvas.axes.xaxis.get_major_formatter()
+        assert isinstance(formatter, mdates.ConciseDateFormatter)
+        
+        canvas.set_view_mode("calendar")
+        canvas._do_render()
+        assert canvas.axes.xaxis.get_major_formatter() is formatter
+    
+    def test_filter_change_reuses_artists(self, sample_events):
+        """Test re-rendering in the same view mode updates artists in place."""
+        sample_events[0].timelines = [Mock(id="tl-1")]
+        canvas = TimelineCanvas()
+        canvas.set_events(sample_events)
+        canvas._do_render()
+        scatter = canvas._scatter
+        label = canvas.axes.texts[0]
+        
+        canvas.set_timeline_filter(["tl-1"])
+        canvas._do_render()
+        assert canvas._scatter is scatter
+        assert canvas.axes.texts[0] is label
+        assert len(canvas.axes.texts) == 1
+        assert len(scatter.get_offsets()) == 1
+        
+        canvas.set_view_mode("calendar")
+        canvas._do_render()
+        assert canvas._scatter is None
+        assert len(canvas.axes.collections) == 0
+    
+    def test_renderer_selected_with_view_mode(self, sample_events, sample_timelines):
+        """Test the render method is picked when the mode or timelines change."""
+        canvas = TimelineCanvas()
+        canvas.set_events(sample_events)
+        canvas.set_view_mode("swimlane")
+        assert canvas._render_view == canvas._render_linear
+        
+        canvas.set_events(sample_events, sample_timelines)
+        assert canvas._render_view == canvas._render_swimlane
+        
+        canvas.set_view_mode("calendar")
+        assert canvas._render_view == canvas._render_calendar
+    
+    def test_unchanged_settings_skip_render(self, sample_events):
+        """Test setters don't schedule a render when the value is unchanged."""
+        canvas = TimelineCanvas()
+        canvas.set_events(sample_events)
+        canvas._do_render()
+        
+        canvas.set_view_mode("linear")
+        canvas.set_zoom(1.0)
+        canvas.set_timeline_filter([])
+        canvas.set_current_marker(None)
+        assert not canvas._render_timer.isActive()
+        
+        canvas.set_zoom(2.0)
+        assert canvas._render_timer.isActive()
+    
     def test_current_marker(self, sample_events):
         """Test current date marker."""
         canvas = TimelineCanvas()
@@ -142,6 +292,42 @@ class TestTimelineCanvas:
         canvas.set_current_marker(marker_date)
         assert canvas.current_marker_date == marker_date
     
+    def test_marker_move_blits(self, sample_events):
+        """Test moving the marker updates the line without a full render."""
+        canvas = TimelineCanvas()
+        canvas.set_events(sample_events)
+        canvas.set_current_marker(datetime(2021, 6, 1))
+        canvas._do_render()
+        canvas.draw()
+        line = canvas._marker_line
+        assert line is not None and line.get_animated()
+        
+        canvas.render_timeline = Mock()
+        canvas.set_current_marker(datetime(2022, 6, 1))
+        canvas.render_timeline.assert_not_called()
+        assert canvas._marker_line is line
+        assert line.get_xdata()[0] == mdates.date2num(datetime(2022, 6, 1))
+        
+        # Leaving the visible range still needs a full render
+        canvas.set_current_marker(datetime(2100, 1, 1))
+        canvas.render_timeline.assert_called_once()
+    
+    def test_renders_coalesced(self, sample_events):
+        """Test a burst of setter calls renders the timeline once."""
+        from PyQt6.QtTest import QTest
+        
+        canvas = TimelineCanvas()
+        draws = []
+        canvas.mpl_connect('draw_event', draws.append)
+        
+        canvas.set_events(sample_events)
+        for value in range(1, 20):
+            canvas.set_zoom(value / 10.0)
+        canvas.set_view_mode("swimlane")
+        assert draws == []
+        QTest.qWait(100)
+        assert len(draws) == 1
+    
     def test_timeline_filtering(self, sample_events, sample_timelines):
         """Test filtering events by timeline."""
         canvas = TimelineCanvas()
@@ -160,6 +346,32 @@ class TestTimelineCanvas:
         # Should get events 0 and 2
         assert len(filtered) == 2
 
+    
+    def test_swimlane_single_scatter(self, sample_events, sample_timelines):
+        """Test swimlane view draws the markers and the lane bands as one collection each."""
+        canvas = TimelineCanvas()
+        for i, event in enumerate(sample_events):
+            event.timelines = [sample_timelines[i % 2]]
+        canvas.set_events(sample_events, sample_timelines)
+        canvas.set_view_mode("swimlane")
+        canvas._do_render()
+        
+        assert len(canvas.axes.collections) == 2
+        assert len(canvas.axes.patches) == 0
+        offsets = canvas._scatter.get_offsets()
+        assert sorted(offsets[:, 1]) == [0, 0, 0, 1, 1]
+    
+    def test_linear_uses_sorted_cache(self, sample_events):
+        """Test events are sorted once when set and drawn in date order."""
+        canvas = TimelineCanvas()
+        sample_events[1].exact_date = None
+        sample_events[1].year = None
+        canvas.set_events(list(reversed(sample_events)))
+        canvas._do_render()
+        
+        assert list(canvas._sorted_idx) == [4, 2, 1, 0, 3]
+        labels = [text.get_text().strip() for text in canvas.axes.texts]
+        assert labels == ["Test Event 0", "Test Event 2", "Test Event 3", "Test Event 4"]
 
 class TestTimelineWidget:
     """Test timeline widget functionality."""
@@ -190,6 +402,82 @@ class TestTimelineWidget:
         widget.zoom_slider.setValue(10)
         assert widget.canvas.zoom_level == 1.0
 
+    
+    def test_refresh_populates_event_list(self, sample_events):
+        """Test refresh lists every event with the event attached."""
+        event_service = Mock()
+        event_service.get_sorted_by_date.return_value = list(sample_events)
+        widget = TimelineWidget(event_service=event_service)
+        widget.set_universe("universe-1")
+        wait_for_refresh()
+        
+        model = widget.event_list.model()
+        assert model.rowCount() == 5
+        index = model.index(0)
+        assert index.data() == "2020-01-01 - Test Event 0"
+        assert index.data(Qt.ItemDataRole.UserRole) is sample_events[0]
+    
+    def test_refresh_lists_events_in_date_order(self, sample_events):
+        """Test the event list follows the canvas's date order."""
+        event_service = Mock()
+        event_service.get_sorted_by_date.return_value = list(reversed(sample_events))
+        widget = TimelineWidget(event_service=event_service)
+        widget.set_universe("universe-1")
+        wait_for_refresh()
+        
+        model = widget.event_list.model()
+        listed = [model.index(row).data(Qt.ItemDataRole.UserRole)
+                  for row in range(model.rowCount())]
+        assert listed == sample_events
+        assert widget.canvas.sorted_events() == sample_events
+    
+    def test_event_list_double_click_selects_event(self, sample_events):
+        """Test double-clicking a listed event emits it."""
+        event_service = Mock()
+        event_service.get_sorted_by_date.return_value = list(sample_events)
+        widget = TimelineWidget(event_service=event_service)
+        widget.set_universe("universe-1")
+        wait_for_refresh()
+        selected = []
+        widget.event_selected.connect(selected.append)
+        
+        widget.event_list.doubleClicked.emit(widget.event_model.index(2))
+        assert selected == [sample_events[2]]
+    
+    def test_refresh_from_services_in_memory(self):
+        """Test refreshing from services over the GUI thread's session."""
+        db_manager = DatabaseManager()
+        assert db_manager.get_worker_session_factory() is None
+        session = _create_timeline_db(db_manager)
+        
+        widget = TimelineWidget(event_service=EventService(EventRepository(session)),
+                                timeline_service=TimelineService(TimelineRepository(session)))
+        widget.set_universe(1)
+        model = widget.event_model
+        assert [model.index(row).data() for row in range(model.rowCount())] == [
+            " - First", " - Second"]
+        assert widget.timeline_combo.count() == 2
+        
+    def test_refresh_worker_uses_own_session(self, tmp_path):
+        """Test a worker refresh loads rows through its own database session."""
+        db_manager = DatabaseManager(str(tmp_path / "timeline.db"))
+        _create_timeline_db(db_manager)
+        
+        widget = TimelineWidget(session_factory=db_manager.get_worker_session_factory())
+        widget.set_universe(1)
+        assert widget.loading_bar.isVisibleTo(widget)
+        widget.refresh()
+        
+        # Only the latest refresh updates the views
+        widget._on_refresh_finished(1, [], [])
+        assert widget.event_model.rowCount() == 0
+        wait_for_refresh()
+        model = widget.event_model
+        assert [model.index(row).data() for row in range(model.rowCount())] == [
+            " - First", " - Second"]
+        assert widget.timeline_combo.count() == 2
+        assert not widget.loading_bar.isVisibleTo(widget)
+
 
 class TestRelationshipGraphCanvas:
     """Test relationship graph canvas functionality."""
@@ -230,6 +518,87 @@ class TestRelationshipGraphCanvas:
         
         canvas.set_show_labels(True)
         assert canvas.show_labels is True
+        
+        # The legend is reused while the entity types are unchanged
+        legend = canvas._legend
+        canvas.set_show_labels(False)
+        assert canvas._legend is legend
+        assert legend in canvas.axes.get_children()
+    
+    def test_label_toggle_keeps_layout(self, sample_figures, sample_relationships):
+        """Test toggling labels redraws without recomputing the layout."""
+        canvas = RelationshipGraphCanvas()
+        canvas.set_data(sample_figures, sample_relationships)
+        pos = canvas._pos
+        
+        canvas.set_show_labels(False)
+        assert canvas._pos is pos
+        
+        canvas.set_layout('circular')
+        assert canvas._pos is not pos
+        
+        # Switching back reuses the cached layout
+        canvas.set_layout('spring')
+        assert canvas._pos is pos
+    
+    def test_label_toggle_after_deferred_layout(self, sample_figures, sample_relationships):
+        """Test redrawing labels lays out a graph whose layout change was deferred."""
+        canvas = RelationshipGraphCanvas()
+        canvas.set_data(sample_figures, sample_relationships)
+        
+        canvas.set_layout('circular', redraw=False)
+        assert canvas._pos is None
+        
+        canvas.set_show_labels(False)
+        assert len(canvas._pos) == canvas.graph.number_of_nodes()
+    
+    def test_fr_layout_kernel(self):
+        """Test the force-directed kernel spreads out a path graph."""
+        import numpy as np
+        
+        pos = np.random.default_rng(0).random((4, 2))
+        edges_src = np.array([0, 1, 2], dtype=np.int64)
+        edges_dst = np.array([1, 2, 3], dtype=np.int64)
+        
+        fr_layout(pos, edges_src, edges_dst, 50, 0.5)
+        
+        assert np.isfinite(pos).all()
+        # Path ends are pushed further apart than neighbouring nodes
+        assert np.linalg.norm(pos[0] - pos[3]) > np.linalg.norm(pos[0] - pos[1])
+    
+    def test_compiled_layout_only_for_large_graphs(self, sample_figures, sample_relationships):
+        """Test small graphs use NetworkX's spring layout, not the compiled kernel."""
+        canvas = RelationshipGraphCanvas()
+        canvas._compiled_spring_layout = Mock(side_effect=AssertionError)
+        canvas.set_data(sample_figures, sample_relationships)
+        assert canvas.graph.number_of_nodes() < canvas.COMPILED_LAYOUT_MIN_NODES
+        assert len(canvas._pos) == canvas.graph.number_of_nodes()
+    
+    def test_layout_kernel_warmed_up_only_for_large_data(self, sample_figures, sample_relationships):
+        """Test the compiled kernel is only warmed up once the data is large enough."""
+        kernel = Mock()
+        with patch('worldbuilder.widgets.relationship_graph_widget._fr_layout_module',
+                   return_value=kernel):
+            canvas = RelationshipGraphCanvas()
+            canvas.set_data(sample_figures, sample_relationships)
+            kernel.warm_up.assert_not_called()
+            
+            canvas.COMPILED_LAYOUT_MIN_NODES = len(sample_figures)
+            canvas.set_data(sample_figures, sample_relationships)
+            kernel.warm_up.assert_called_once()
+    
+    def test_optional_accelerators_not_imported_at_startup(self):
+        """Test importing the graph widget loads neither numba nor scipy.spatial."""
+        code = (
+            "import sys\n"
+            "import worldbuilder.widgets.relationship_graph_widget\n"
+            "assert 'numba' not in sys.modules\n"
+            "assert 'scipy.spatial' not in sys.modules\n"
+        )
+        src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, '-c', code], cwd=src_dir,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
     
     def test_entity_focus(self, sample_figures, sample_relationships):
         """Test focusing on specific entity."""
@@ -243,9 +612,98 @@ class TestRelationshipGraphCanvas:
         # Should rebuild graph with only focused entity and connections
         assert len(canvas.graph.nodes()) <= len(sample_figures)
         
+        # A middle figure keeps both neighbours and the edges to them
+        canvas.focus_on_entity(sample_figures[2].id)
+        assert set(canvas.graph.nodes()) == {f.id for f in sample_figures[1:4]}
+        assert canvas.graph.number_of_edges() == 2
+        
         # Clear focus
         canvas.clear_focus()
         assert canvas.focused_entity_id is None
+    
+    def test_type_filter(self, sample_figures, sample_relationships):
+        """Test hiding an entity type removes its nodes and edges."""
+        canvas = RelationshipGraphCanvas()
+        canvas.set_data(sample_figures, sample_relationships)
+        
+        canvas.set_type_filter({'Mock'})
+        assert canvas.graph.number_of_nodes() == 0
+        
+        canvas.set_type_filter(set())
+        assert canvas.graph.number_of_nodes() == len(sample_figures)
+        assert canvas.graph.number_of_edges() == len(sample_relationships)
+    
+    def test_hover_highlight_blits(self, sample_figures, sample_relationships):
+        """Test hovering a node highlights it without a full redraw."""
+        canvas = RelationshipGraphCanvas()
+        canvas.set_data(sample_figures, sample_relationships)
+        assert canvas._background is not None
+        
+        canvas.draw = Mock()
+        x, y = canvas._pos[sample_figures[1].id]
+        canvas._on_motion(Mock(inaxes=canvas.axes, xdata=x, ydata=y))
+        assert canvas._hovered_node == sample_figures[1].id
+        assert tuple(canvas._hover_artist.get_offsets()[0]) == (x, y)
+        
+        canvas._on_motion(Mock(inaxes=None, xdata=None, ydata=None))
+        assert canvas._hovered_node is None
+        canvas.draw.assert_not_called()
+    
+    def test_large_graph_grouped_into_communities(self):
+        """Test large graphs are drawn as communities that expand on click."""
+        figures = []
+        relationships = []
+        for group in range(5):
+            members = []
+            for i in range(50):
+                figure = Mock()
+                figure.id = f"figure-{group}-{i}"
+                figure.name = f"Character {group}-{i}"
+                members.append(figure)
+            for i in range(50):
+                rel = Mock()
+                rel.from_figure_id = members[i].id
+                rel.to_figure_id = members[(i + 1) % 50].id
+                rel.type = 'friend'
+                rel.strength = 5
+                relationships.append(rel)
+            figures.extend(members)
+        
+        canvas = RelationshipGraphCanvas()
+        canvas.set_data(figures, relationships)
+        assert 1 < canvas.graph.number_of_nodes() < len(figures)
+        assert all(node_id in canvas._community_map for node_id in canvas.graph)
+        
+        community_id = next(iter(canvas.graph))
+        x, y = canvas._pos[community_id]
+        canvas._on_click(Mock(inaxes=canvas.axes, xdata=x, ydata=y))
+        assert set(canvas.graph.nodes()) == canvas._community_map[community_id]
+        
+        canvas.clear_focus()
+        assert community_id in canvas.graph
+    
+    def test_node_click_uses_drawn_positions(self, sample_figures, sample_relationships):
+        """Test clicking a node hit-tests against the rendered layout."""
+        canvas = RelationshipGraphCanvas()
+        canvas.set_data(sample_figures, sample_relationships)
+        
+        clicked = []
+        canvas.node_clicked.connect(clicked.append)
+        
+        x, y = canvas._pos[sample_figures[2].id]
+        canvas._on_click(Mock(inaxes=canvas.axes, xdata=x, ydata=y))
+        assert clicked == [sample_figures[2]]
+        
+        canvas._on_click(Mock(inaxes=canvas.axes, xdata=x + 5.0, ydata=y + 5.0))
+        assert clicked == [sample_figures[2]]
+        
+        # Without scipy the NumPy scan gives the same answer
+        canvas._kdtree = None
+        with patch('worldbuilder.widgets.relationship_graph_widget._kdtree_class',
+                   return_value=None):
+            canvas._on_click(Mock(inaxes=canvas.axes, xdata=x, ydata=y))
+        assert canvas._kdtree is None
+        assert clicked == [sample_figures[2], sample_figures[2]]
 
 
 class TestRelationshipGraphWidget:
@@ -276,6 +734,46 @@ class TestRelationshipGraphWidget:
         
         widget.labels_checkbox.setChecked(True)
         assert widget.canvas.show_labels is True
+    
+    def test_toolbar_changes_coalesced(self, sample_figures, sample_relationships):
+        """Test rapid toolbar changes are rendered once after a short delay."""
+        from PyQt6.QtTest import QTest
+        
+        widget = RelationshipGraphWidget()
+        widget.canvas.set_data(sample_figures, sample_relationships)
+        
+        widget.layout_combo.setCurrentText("Circular")
+        widget.labels_checkbox.setChecked(False)
+        widget.layout_combo.setCurrentText("Shell")
+        assert widget.canvas._pos is None
+        assert widget._render_timer.isActive()
+        
+        QTest.qWait(100)
+        assert widget.canvas.layout_algorithm == "shell"
+        assert widget.canvas._pos is not None
+    
+    def test_refresh_reuses_layout(self, sample_figures, sample_relationships):
+        """Test refresh skips unchanged data and keeps existing node positions."""
+        figure_service = Mock()
+        figure_service.get_by_universe.return_value = sample_figures[:4]
+        relationship_service = Mock()
+        relationship_service.get_by_universe.return_value = sample_relationships[:3]
+        
+        widget = RelationshipGraphWidget(relationship_service, figure_service)
+        widget.set_universe(1)
+        pos = widget.canvas._pos
+        
+        # Unchanged data leaves the canvas untouched
+        widget.refresh()
+        assert widget.canvas._pos is pos
+        
+        # A new figure is placed around the existing ones
+        figure_service.get_by_universe.return_value = sample_figures
+        relationship_service.get_by_universe.return_value = sample_relationships
+        widget.refresh()
+        assert widget.canvas.graph.number_of_nodes() == 5
+        for figure in sample_figures[:4]:
+            assert tuple(widget.canvas._pos[figure.id]) == tuple(pos[figure.id])
 
 
 class TestCustomCalendar:
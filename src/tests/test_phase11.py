@@ -8,6 +8,7 @@ import os
 import pytest
 import tempfile
 import shutil
+from unittest.mock import Mock
 from pathlib import Path
 
 # Add src directory to path
@@ -44,6 +45,47 @@ class TestRichTextEditor:
         editor = RichTextEditor(enable_markdown=False)
         assert editor.enable_markdown is False
         
+    def test_markdown_conversion(self):
+        """Test leaving markdown mode renders the edited markdown"""
+        editor = RichTextEditor(enable_markdown=True)
+        editor.markdown_button.setChecked(True)
+        editor.set_text("**Bold** text")
+        editor.markdown_button.setChecked(False)
+        assert editor.get_text() == "Bold text"
+        assert "font-weight:700" in editor.get_html()
+        
+    def test_unedited_markdown_toggle_restores_rich_text(self):
+        """Test leaving markdown mode without edits skips the conversion"""
+        editor = RichTextEditor(enable_markdown=True)
+        editor.set_html("<b>Bold</b> text")
+        editor.markdown_button.setChecked(True)
+        editor.markdown_button.setChecked(False)
+        assert editor.get_text() == "Bold text"
+        assert "font-weight:700" in editor.get_html()
+        
+    def test_markdown_toggle_emits_text_changed_once(self):
+        """Test switching modes signals a single content change"""
+        editor = RichTextEditor(enable_markdown=True)
+        editor.set_text("the **wizzard**")
+        editor.toggle_spell_check(True)
+        QApplication.processEvents()  # Attaching highlights on the next pass
+        changes = []
+        editor.textChanged.connect(lambda: changes.append(True))
+        editor.markdown_button.setChecked(True)
+        editor.markdown_button.setChecked(False)
+        assert len(changes) == 2
+        
+        block = editor.text_edit.document().firstBlock()
+        assert [(r.start, r.length) for r in block.layout().formats()] == [(6, 7)]
+        
+    def test_markdown_mode_keeps_formatting(self):
+        """Test entering markdown mode shows formatting as markup"""
+        editor = RichTextEditor(enable_markdown=True)
+        editor.set_html("<b>Bold</b> text")
+        assert editor.get_markdown().strip() == "**Bold** text"
+        editor.markdown_button.setChecked(True)
+        assert editor.get_text() == "**Bold** text"
+        
     def test_set_get_text(self):
         """Test setting and getting plain text"""
         editor = RichTextEditor()
@@ -77,6 +119,19 @@ class TestRichTextEditor:
         assert editor.text_edit.isReadOnly() is False
         assert editor.toolbar.isEnabled() is True
         
+    def test_read_only_stops_toolbar_tracking(self):
+        """Test the toolbar ignores cursor moves while read-only"""
+        editor = RichTextEditor()
+        editor.set_html("plain <b>bold</b>")
+        editor.set_read_only(True)
+        cursor = editor.text_edit.textCursor()
+        cursor.setPosition(8)
+        editor.text_edit.setTextCursor(cursor)
+        assert editor.bold_btn.isChecked() is False
+        
+        editor.set_read_only(False)
+        assert editor.bold_btn.isChecked() is True
+        
     def test_formatting_buttons_exist(self):
         """Test that all formatting buttons exist"""
         editor = RichTextEditor()
@@ -94,6 +149,46 @@ class TestRichTextEditor:
         assert editor.font_combo is not None
         assert editor.font_size_spin is not None
         
+    def test_cursor_move_does_not_reapply_font(self):
+        """Test syncing the toolbar to the cursor does not merge a new format"""
+        editor = RichTextEditor()
+        editor.set_html('<span style="font-size:20pt">Large</span> text')
+        editor.merge_format = Mock()
+        cursor = editor.text_edit.textCursor()
+        cursor.setPosition(2)
+        editor.text_edit.setTextCursor(cursor)
+        assert editor.font_size_spin.value() == 20
+        editor.merge_format.assert_not_called()
+        
+    def test_toolbar_formats_reused(self):
+        """Test toolbar toggles apply the prebuilt formats"""
+        editor = RichTextEditor()
+        editor.set_text("word")
+        editor.text_edit.selectAll()
+        editor.bold_btn.setChecked(True)
+        editor.toggle_bold()
+        editor.change_font_size(18)
+        
+        fmt = editor.text_edit.textCursor().charFormat()
+        assert fmt.fontWeight() == 700
+        assert fmt.fontPointSize() == 18
+        assert editor._tmp_fmt.isEmpty()
+        
+    def test_merge_format_without_selection(self):
+        """Test formatting with no selection applies to the word and typing"""
+        editor = RichTextEditor()
+        editor.set_text("one two")
+        cursor = editor.text_edit.textCursor()
+        cursor.setPosition(1)
+        editor.text_edit.setTextCursor(cursor)
+        editor.merge_format(editor._italic_on)
+        
+        cursor.setPosition(2)
+        assert cursor.charFormat().fontItalic() is True
+        assert editor.text_edit.currentCharFormat().fontItalic() is True
+        cursor.setPosition(6)
+        assert cursor.charFormat().fontItalic() is False
+        
     def test_spell_check_feature(self):
         """Test spell check functionality"""
         editor = RichTextEditor(enable_spell_check=True)
@@ -107,6 +202,42 @@ class TestRichTextEditor:
         editor.toggle_spell_check(False)
         assert editor.spell_checker.spell_check_enabled is False
         
+    def test_spell_check_underlines_unknown_words(self):
+        """Test spell check marks unknown lowercase words only"""
+        editor = RichTextEditor(enable_spell_check=True)
+        editor.set_text("the wizzard saw Elrond at the tower")
+        assert editor.spell_checker.document() is None
+        editor.toggle_spell_check(True)
+        QApplication.processEvents()  # Attaching highlights on the next pass
+        
+        block = editor.text_edit.document().firstBlock()
+        spans = [(r.start, r.length) for r in block.layout().formats()]
+        # "wizzard saw" and "tower" are unknown (adjacent misses share one
+        # span); "Elrond" is a proper noun
+        assert spans == [(4, 11), (30, 5)]
+        
+        editor.toggle_spell_check(False)
+        assert block.layout().formats() == []
+        assert editor.spell_checker.document() is None
+        
+    def test_spell_check_word_boundaries(self):
+        """Test quotes, digits and wide characters around words"""
+        editor = RichTextEditor()
+        editor.set_text("'wizzard' abc123 \U0001F409 wizzard's")
+        editor.toggle_spell_check(True)
+        QApplication.processEvents()  # Attaching highlights on the next pass
+        block = editor.text_edit.document().firstBlock()
+        spans = [(r.start, r.length) for r in block.layout().formats()]
+        assert spans == [(1, 7), (20, 9)]
+        
+    def test_spell_check_remembers_clean_blocks(self):
+        """Test blocks without misspellings are not rescanned"""
+        editor = RichTextEditor()
+        editor.set_text("the world and the story\nthe wizzard")
+        editor.toggle_spell_check(True)
+        QApplication.processEvents()  # Attaching highlights on the next pass
+        assert editor.spell_checker._clean_blocks == {"the world and the story"}
+        
     def test_spell_check_disabled(self):
         """Test editor without spell check"""
         editor = RichTextEditor(enable_spell_check=False)
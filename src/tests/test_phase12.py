@@ -412,6 +412,18 @@ class TestGettingStartedWizard:
         
         # Default should be True
         assert wizard.should_show_again() is True
+        
+    def test_pages_built_on_first_visit(self):
+        """Test page text is only created when a page is shown"""
+        wizard = GettingStartedWizard()
+        pages = [wizard.page(page_id) for page_id in wizard.pageIds()]
+        assert all(page.text_label is None for page in pages)
+        
+        wizard.restart()
+        wizard.next()
+        assert pages[0].text_label is not None
+        assert pages[1].text_label is not None
+        assert pages[2].text_label is None
 
 
 def run_phase_12_tests():
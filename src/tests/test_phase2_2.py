@@ -80,13 +80,155 @@ def test_universe_details_panel():
     # Test with universe
     panel.set_universe(universe)
     assert panel._current_universe is not None
-    assert panel.name_label[2].text() == "Test Universe"
-    assert panel.author_label[2].text() == "Test Author"
+    assert "Test Universe" in panel.basic_info_label.text()
+    assert "Test Author" in panel.basic_info_label.text()
     print("✓ Universe details display works")
     
+    # Re-selecting the same unmodified universe skips the refresh
+    panel.basic_info_label.setText("unchanged")
+    panel.set_universe(universe)
+    assert panel.basic_info_label.text() == "unchanged"
+    
+    service.update_universe(universe.id, author="New Author")
+    panel.set_universe(universe)
+    assert "New Author" in panel.basic_info_label.text()
+    print("✓ Redundant refreshes skipped, edits still shown")
+    
+    session.close()
+
+
+def test_universe_list_view():
+    """Test universe list view model and selection."""
+    from worldbuilder.views import UniverseListView
+    from PyQt6.QtWidgets import QApplication
+    
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    
+    print("\nTesting Universe List View...")
+    
+    db_manager = DatabaseManager()
+    db_manager.create_tables()
+    session = db_manager.get_session()
+    repository = UniverseRepository(session)
+    service = UniverseService(repository)
+    
+    service.create_universe(name="Arrakis", author="Frank Herbert")
+    dune = service.create_universe(name="Caladan", genre="Science Fiction")
+    
+    list_view = UniverseListView()
+    selected = []
+    list_view.universe_selected.connect(selected.append)
+    
+    list_view.load_universes(service.get_all_universes())
+    assert list_view.model.rowCount() == 2
+    assert list_view.get_selected_universe_id() is None
+    print("✓ Universes loaded")
+    
+    list_view.table.selectRow(0)
+    list_view.table.selectRow(1)
+    assert list_view.get_selected_universe_id() == dune.id
+    assert list_view.open_button.isEnabled()
+    print("✓ Selection returns universe ID")
+    
+    # Rapid selection changes are coalesced into one emission
+    assert selected == []
+    app.processEvents()
+    assert selected == [dune.id]
+    print("✓ Selection emission coalesced")
+    
     session.close()
 
 
+def test_entity_table_model_fetch_more():
+    """Test that entity table models expose rows in batches."""
+    from worldbuilder.views.universe_list_view import UniverseTableModel
+    
+    print("\nTesting Entity Table Model Batching...")
+    
+    batch = UniverseTableModel.FETCH_BATCH_SIZE
+    universes = [Universe(id=i, name=f"Universe {i}") for i in range(1, batch * 2 + 11)]
+    
+    model = UniverseTableModel()
+    model.set_rows(universes)
+    assert model.rowCount() == batch
+    assert model.canFetchMore()
+    print(f"✓ First batch: {model.rowCount()} rows")
+    
+    # Only fetched rows are snapshotted for diffing
+    assert len(model._signatures) == batch
+    changed = []
+    model.dataChanged.connect(lambda top_left, bottom_right: changed.append(top_left.row()))
+    universes[-1].name = "Renamed"
+    model.update_rows(universes)
+    assert changed == []
+    assert len(model._signatures) == batch
+    print("✓ Unfetched rows not diffed")
+    
+    model.fetchMore()
+    model.fetchMore()
+    assert model.rowCount() == len(universes)
+    assert not model.canFetchMore()
+    assert len(model._signatures) == len(universes)
+    assert model.entity_at(len(universes) - 1).name == "Renamed"
+    print(f"✓ All {model.rowCount()} rows fetched")
+
+
+def test_entity_table_model_update_rows():
+    """Test that entity table models diff-update their rows."""
+    from worldbuilder.views.universe_list_view import UniverseTableModel
+    
+    print("\nTesting Entity Table Model Diff Updates...")
+    
+    first = Universe(id=1, name="First")
+    second = Universe(id=2, name="Second")
+    third = Universe(id=3, name="Third")
+    
+    model = UniverseTableModel()
+    model.set_rows([first, second])
+    
+    # Plain columns show the entity attribute named in COLUMNS
+    assert model.data(model.index(0, 0)) == "1"
+    assert model.data(model.index(0, 1)) == "First"
+    assert model.data(model.index(0, 2)) == ""  # No author
+    
+    resets = []
+    changed = []
+    inserted = []
+    removed = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.dataChanged.connect(lambda top_left, bottom_right: changed.append(top_left.row()))
+    model.rowsInserted.connect(lambda parent, start, end: inserted.append(start))
+    model.rowsRemoved.connect(lambda parent, start, end: removed.append(start))
+    
+    # Unchanged list emits nothing
+    model.update_rows([first, second])
+    assert not (resets or changed or inserted or removed)
+    print("✓ Unchanged rows skipped")
+    
+    # Edited row emits dataChanged for that row only
+    second.name = "Second (renamed)"
+    model.update_rows([first, second])
+    assert changed == [1]
+    assert model.data(model.index(1, 1)) == "Second (renamed)"
+    print("✓ Edited row refreshed")
+    
+    # Removal and insertion are signalled per row
+    model.update_rows([second, third])
+    assert removed == [0]
+    assert inserted == [1]
+    assert [model.entity_at(row).id for row in range(model.rowCount())] == [2, 3]
+    assert not resets
+    print("✓ Rows inserted and removed without reset")
+    
+    # Reordered rows fall back to a reset
+    model.update_rows([third, second])
+    assert resets
+    assert model.entity_at(0).id == 3
+    print("✓ Reorder resets model")
+
+
 def test_universe_settings_dialog():
     """Test universe settings dialog."""
     from worldbuilder.views import UniverseSettingsDialog
@@ -125,6 +267,12 @@ def test_universe_settings_dialog():
     print(f"✓ Default calendar: {settings['calendar_type']}")
     print(f"✓ Days per week: {settings['days_per_week']}")
     
+    # Form widgets are built on first show and report the same defaults
+    dialog.show()
+    assert dialog.get_settings() == settings
+    dialog.close()
+    print("✓ Form built on first show")
+    
     session.close()
 
 
@@ -135,6 +283,9 @@ if __name__ == "__main__":
     
     test_recent_universes_persistence()
     test_universe_details_panel()
+    test_universe_list_view()
+    test_entity_table_model_fetch_more()
+    test_entity_table_model_update_rows()
     test_universe_settings_dialog()
     
     print("\n" + "=" * 60)
@@ -247,7 +247,7 @@ def test_species_ui_components():
     species_list = species_service.get_all_species(universe.id)
     list_view.load_species(species_list)
     
-    assert list_view.table.rowCount() == 2
+    assert list_view.model.rowCount() == 2
     print(f"   ✓ List view loaded {len(species_list)} species")
     
     session.close()
@@ -252,6 +252,82 @@ def test_search_ui_components():
     print(f"   ✓ Filter clearing works")
 
 
+def test_search_widget_search_requested():
+    """Test that SearchWidget emits search requests with type filters."""
+    from worldbuilder.views.search_widget import SearchWidget
+    from PyQt6.QtWidgets import QApplication
+    
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    
+    print("\nTesting Search Requests...")
+    
+    search_widget = SearchWidget()
+    requests = []
+    search_widget.search_requested.connect(lambda q, types: requests.append((q, types)))
+    
+    search_widget.search_input.setText("frodo")
+    search_widget._perform_search()
+    assert len(requests) == 1
+    assert requests[0][0] == "frodo"
+    assert len(requests[0][1]) == 7
+    print("   ✓ Search request emitted with all types")
+    
+    # Identical consecutive searches are skipped
+    search_widget._perform_search()
+    assert len(requests) == 1
+    print("   ✓ Identical search skipped")
+    
+    # Changing the type filter issues a new, narrower request
+    search_widget.filter_checks['timeline'].setChecked(False)
+    search_widget._perform_search()
+    assert len(requests) == 2
+    assert 'timeline' not in requests[1][1]
+    print("   ✓ Type filter passed to request")
+
+
+def test_search_widget_chunked_results():
+    """Test that SearchWidget streams large result sets in batches."""
+    from worldbuilder.views.search_widget import SearchWidget
+    from worldbuilder.services.search_service import SearchResult
+    from PyQt6.QtWidgets import QApplication
+    
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    
+    print("\nTesting Chunked Result Loading...")
+    
+    class MockEntity:
+        def __init__(self, name):
+            self.name = name
+    
+    total = SearchWidget.RESULTS_CHUNK_SIZE * 2 + 50
+    results = [
+        SearchResult("location", i, MockEntity(f"Place {i}"), "name", f"Place {i}")
+        for i in range(total)
+    ]
+    
+    search_widget = SearchWidget()
+    search_widget.load_results(results)
+    assert search_widget.results_table.rowCount() == SearchWidget.RESULTS_CHUNK_SIZE
+    assert search_widget.results_label.text().startswith("Loaded")
+    print(f"   ✓ First batch: {search_widget.results_table.rowCount()} rows")
+    
+    while search_widget.results_table.rowCount() < total:
+        app.processEvents()
+    assert search_widget.results_table.item(total - 1, 1).text() == f"Place {total - 1}"
+    assert search_widget.results_label.text() == f"Found {total} result(s)"
+    print(f"   ✓ All {total} rows loaded")
+    
+    # A new load replaces any batches still pending
+    search_widget.load_results(results[:3])
+    app.processEvents()
+    assert search_widget.results_table.rowCount() == 3
+    print("   ✓ Reload resets pending batches")
+
+
 def test_search_result_object():
     """Test SearchResult object."""
     from worldbuilder.services.search_service import SearchResult
@@ -287,6 +363,8 @@ if __name__ == "__main__":
     test_universe_scoped_search()
     test_search_snippet()
     test_search_ui_components()
+    test_search_widget_search_requested()
+    test_search_widget_chunked_results()
     
     print("\n" + "=" * 70)
     print("✓ ALL PHASE 8 TESTS PASSED!")
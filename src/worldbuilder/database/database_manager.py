@@ -37,6 +37,18 @@ class DatabaseManager:
         """Get a new database session."""
         return self.Session()
     
+    def get_worker_session_factory(self):
+        """Get a factory for sessions used off the main thread.
+        
+        Each worker should open its own session; sessions must not be shared
+        between threads.
+        
+        Returns:
+            Session factory, or None for an in-memory database, whose data
+            only exists on the connection of the thread that created it
+        """
+        return self.session_factory if self.db_path else None
+    
     def close_session(self):
         """Close current session."""
         self.Session.remove()
@@ -0,0 +1,189 @@
+"""Table model shared by the entity list views."""
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from typing import Any, List, Optional, Tuple
+
+
+# Qt enum members resolved once; data() runs for every painted cell
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_UR = Qt.ItemDataRole.UserRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+
+
+class EntityTableModel(QAbstractTableModel):
+    """Read-only table model backed by a plain list of entities.
+    
+    Subclasses set ``HEADERS`` and ``COLUMNS``, the entity attribute shown in
+    each column; they override ``_display_text`` for columns that need
+    formatting, and may override ``_alignment`` and ``_foreground`` for
+    per-cell styling. The ID of the entity on each row is exposed through
+    ``Qt.ItemDataRole.UserRole``.
+    
+    Rows are exposed to the view ``FETCH_BATCH_SIZE`` at a time; the view calls
+    ``fetchMore`` as the user scrolls towards the end of the loaded rows.
+    """
+    
+    HEADERS: List[str] = []
+    COLUMNS: Tuple[str, ...] = ()  # Entity attribute per column, for _display_text
+    FETCH_BATCH_SIZE = 200
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Any] = []
+        self._signatures: List[tuple] = []  # Display values per fetched row, for diffing
+        self._loaded = 0
+    
+    def set_rows(self, rows: List[Any]):
+        """Replace the model contents.
+        
+        Args:
+            rows: Entities to display, one per row
+        """
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._loaded = min(len(self._rows), self.FETCH_BATCH_SIZE)
+        self._signatures = [self._row_signature(entity) for entity in self._rows[:self._loaded]]
+        self.endResetModel()
+    
+    def update_rows(self, rows: List[Any]):
+        """Update the model to match a new entity list, touching only changed rows.
+        
+        Rows are matched by entity ID. Removed and added entities are signalled
+        as row removals/insertions and fetched rows whose display values changed
+        emit dataChanged, so unchanged rows are not repainted and persistent
+        indexes on them stay valid. Falls back to a full reset when no rows are
+        shared or the shared rows changed order.
+        
+        Args:
+            rows: Entities to display, one per row
+        """
+        new_rows = list(rows)
+        old_ids = [entity.id for entity in self._rows]
+        new_ids = [entity.id for entity in new_rows]
+        old_id_set = set(old_ids)
+        new_id_set = set(new_ids)
+        
+        kept_ids = [entity_id for entity_id in old_ids if entity_id in new_id_set]
+        if not kept_ids or kept_ids != [entity_id for entity_id in new_ids if entity_id in old_id_set]:
+            self.set_rows(new_rows)
+            return
+        
+        # Drop rows that are gone, bottom-up so earlier indices stay valid
+        for row in range(len(self._rows) - 1, -1, -1):
+            if self._rows[row].id not in new_id_set:
+                self._remove_row(row)
+        
+        # Surviving rows are now in new-list order, so walk both lists together
+        last_column = self.columnCount() - 1
+        for row, entity in enumerate(new_rows):
+            if row < len(self._rows) and self._rows[row].id == entity.id:
+                self._rows[row] = entity
+                # Rows not fetched yet have no signature; fetchMore takes one
+                if row < self._loaded:
+                    signature = self._row_signature(entity)
+                    if signature != self._signatures[row]:
+                        self._signatures[row] = signature
+                        self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+            else:
+                self._insert_row(row, entity)
+    
+    def _remove_row(self, row: int):
+        """Remove a single row, notifying views if it has been fetched."""
+        if row < self._loaded:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            del self._signatures[row]
+            self._loaded -= 1
+            self.endRemoveRows()
+        else:
+            del self._rows[row]
+    
+    def _insert_row(self, row: int, entity: Any):
+        """Insert a single row, notifying views if it lands in the fetched range."""
+        if row < self._loaded or self._loaded == len(self._rows):
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._rows.insert(row, entity)
+            self._signatures.insert(row, self._row_signature(entity))
+            self._loaded += 1
+            self.endInsertRows()
+        else:
+            self._rows.insert(row, entity)
+    
+    def _row_signature(self, entity: Any) -> tuple:
+        """Get the values that determine how a row is displayed."""
+        return tuple(self._display_text(entity, column) for column in range(len(self.HEADERS)))
+    
+    def entity_at(self, row: int) -> Optional[Any]:
+        """Get the entity displayed on a row.
+        
+        Args:
+            row: Row index
+        
+        Returns:
+            Entity or None if the row is out of range
+        """
+        if 0 <= row < self._loaded:
+            return self._rows[row]
+        return None
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._loaded
+    
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._rows)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH_SIZE, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._signatures.extend(self._row_signature(entity)
+                                for entity in self._rows[self._loaded:self._loaded + count])
+        self._loaded += count
+        self.endInsertRows()
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        entity = self._rows[index.row()]
+        column = index.column()
+        
+        if role == _DISPLAY_ROLE:
+            return self._display_text(entity, column)
+        if role == _UR:
+            return entity.id
+        if role == _ALIGNMENT_ROLE:
+            return self._alignment(entity, column)
+        if role == _FOREGROUND_ROLE:
+            return self._foreground(entity, column)
+        return None
+    
+    def _display_text(self, entity: Any, column: int) -> str:
+        """Get the display text for a cell: the column's attribute, or "" if None."""
+        value = getattr(entity, self.COLUMNS[column])
+        return "" if value is None else str(value)
+    
+    def _alignment(self, entity: Any, column: int):
+        """Get the text alignment for a cell, or None for the default."""
+        return None
+    
+    def _foreground(self, entity: Any, column: int):
+        """Get the foreground color for a cell, or None for the default."""
+        return None
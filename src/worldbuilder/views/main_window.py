@@ -211,8 +211,9 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            universes = self.universe_service.get_all_universes()
-            self.universe_list_view.load_universes(universes)
+            universes = self.universe_list_view.load_universes_from_query(
+                self.universe_service.get_all_universes
+            )
             self.recent_widget.update_recent(universes)
             self.set_status_message(f"Loaded {len(universes)} universe(s)")
         except Exception as e:
@@ -49,6 +49,12 @@ class RelationshipListView(QWidget):
         self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
         
+        # Fixed row heights and no word wrap so Qt never measures rows individually
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(24)
+        self.table.setWordWrap(False)
+        self.table.setTextElideMode(Qt.TextElideMode.ElideRight)
+        
         # Connect signals
         self.table.itemSelectionChanged.connect(self._on_selection_changed)
         self.table.itemDoubleClicked.connect(self._on_item_double_clicked)
@@ -79,16 +85,24 @@ class RelationshipListView(QWidget):
             relationships: List of Relationship entities
             entity_names: Dict mapping (type, id) tuples to entity names
         """
-        self.table.setRowCount(0)
         entity_names = entity_names or {}
         
-        for rel in relationships:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
+        # Resolve display names for both endpoints up front
+        names = [
+            (
+                entity_names.get((rel.source_entity_type, rel.source_entity_id),
+                                 f"{rel.source_entity_type}:{rel.source_entity_id}"),
+                entity_names.get((rel.target_entity_type, rel.target_entity_id),
+                                 f"{rel.target_entity_type}:{rel.target_entity_id}"),
+            )
+            for rel in relationships
+        ]
+        
+        self.table.setRowCount(0)
+        self.table.setRowCount(len(relationships))
+        
+        for row, (rel, (source_name, target_name)) in enumerate(zip(relationships, names)):
             # Source
-            source_key = (rel.source_entity_type, rel.source_entity_id)
-            source_name = entity_names.get(source_key, f"{rel.source_entity_type}:{rel.source_entity_id}")
             source_item = QTableWidgetItem(source_name)
             source_item.setData(Qt.ItemDataRole.UserRole, rel.id)
             self.table.setItem(row, 0, source_item)
@@ -98,8 +112,6 @@ class RelationshipListView(QWidget):
             self.table.setItem(row, 1, type_item)
             
             # Target
-            target_key = (rel.target_entity_type, rel.target_entity_id)
-            target_name = entity_names.get(target_key, f"{rel.target_entity_type}:{rel.target_entity_id}")
             target_item = QTableWidgetItem(target_name)
             self.table.setItem(row, 2, target_item)
             
@@ -13,13 +13,28 @@ class SearchWidget(QWidget):
     
     # Signals
     result_selected = pyqtSignal(str, int)  # entity_type, entity_id
+    search_requested = pyqtSignal(str, list)  # query, entity_types
+    
+    # Number of result rows inserted per event-loop iteration
+    RESULTS_CHUNK_SIZE = 200
+    
+    # Longer snippets are truncated for display; the full text stays on the SearchResult
+    MAX_SNIPPET_LENGTH = 200
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._last_key = None  # (query, entity types) of the last search run
+        self._pending_results: List[SearchResult] = []
+        self._results_cursor = 0
         self._setup_ui()
         self._search_timer = QTimer()
         self._search_timer.setSingleShot(True)
         self._search_timer.timeout.connect(self._perform_search)
+        self._chunk_timer = QTimer(self)
+        self._chunk_timer.setSingleShot(True)
+        self._chunk_timer.setInterval(0)
+        self._chunk_timer.timeout.connect(self._load_next_chunk)
+        self._connect_signals()
     
     def _setup_ui(self):
         """Set up the UI components."""
@@ -38,16 +53,12 @@ class SearchWidget(QWidget):
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search across all entities...")
-        self.search_input.textChanged.connect(self._on_search_text_changed)
-        self.search_input.returnPressed.connect(self._perform_search)
         search_layout.addWidget(self.search_input, stretch=3)
         
         self.search_button = QPushButton("Search")
-        self.search_button.clicked.connect(self._perform_search)
         search_layout.addWidget(self.search_button)
         
         self.clear_button = QPushButton("Clear")
-        self.clear_button.clicked.connect(self._clear_search)
         search_layout.addWidget(self.clear_button)
         
         layout.addLayout(search_layout)
@@ -57,6 +68,9 @@ class SearchWidget(QWidget):
         filter_layout = QHBoxLayout()
         
         self.filter_checks = {}
+        # Aligned name/checkbox lists for the get_selected_entity_types hot path
+        self._filter_names: List[str] = []
+        self._filter_checks: List[QCheckBox] = []
         entity_types = [
             ('Universe', 'universe'),
             ('Location', 'location'),
@@ -70,8 +84,9 @@ class SearchWidget(QWidget):
         for display_name, internal_name in entity_types:
             check = QCheckBox(display_name)
             check.setChecked(True)
-            check.stateChanged.connect(self._on_filter_changed)
             self.filter_checks[internal_name] = check
+            self._filter_names.append(internal_name)
+            self._filter_checks.append(check)
             filter_layout.addWidget(check)
         
         filter_group.setLayout(filter_layout)
@@ -97,7 +112,11 @@ class SearchWidget(QWidget):
         self.results_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
         self.results_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
         
-        self.results_table.itemDoubleClicked.connect(self._on_result_double_clicked)
+        # Fixed row heights and no word wrap so Qt never measures rows individually
+        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.results_table.verticalHeader().setDefaultSectionSize(24)
+        self.results_table.setWordWrap(False)
+        self.results_table.setTextElideMode(Qt.TextElideMode.ElideRight)
         
         layout.addWidget(self.results_table)
         
@@ -106,13 +125,28 @@ class SearchWidget(QWidget):
         button_layout.addStretch()
         
         self.view_button = QPushButton("View Selected")
-        self.view_button.clicked.connect(self._on_view_clicked)
         self.view_button.setEnabled(False)
         button_layout.addWidget(self.view_button)
         
         layout.addLayout(button_layout)
+    
+    def _connect_signals(self):
+        """Connect widget signals once the UI and timers are fully built.
+        
+        Keeping this out of _setup_ui means programmatic initialization of the
+        widgets never starts the search debounce timer.
+        """
+        self.search_input.textChanged.connect(self._on_search_text_changed)
+        self.search_input.returnPressed.connect(self._perform_search)
+        self.search_button.clicked.connect(self._perform_search)
+        self.clear_button.clicked.connect(self._clear_search)
         
+        for check in self._filter_checks:
+            check.stateChanged.connect(self._on_filter_changed)
+        
+        self.results_table.itemDoubleClicked.connect(self._on_result_double_clicked)
         self.results_table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.view_button.clicked.connect(self._on_view_clicked)
     
     def _on_search_text_changed(self):
         """Handle search text change with debouncing."""
@@ -128,53 +162,89 @@ class SearchWidget(QWidget):
             self._perform_search()
     
     def _perform_search(self):
-        """Perform the actual search (to be connected to service)."""
+        """Request a search for the current query and entity type filters."""
         query = self.search_input.text().strip()
         if not query:
+            self._last_key = None
+            self._chunk_timer.stop()
             self.results_label.setText("Enter search query...")
             self.results_table.setRowCount(0)
             return
         
-        # This is a placeholder - will be connected to actual service
+        # Skip re-running a search identical to the previous one
+        entity_types = self.get_selected_entity_types()
+        key = (query, tuple(sorted(entity_types)))
+        if key == self._last_key:
+            return
+        self._last_key = key
+        
         self.results_label.setText(f"Searching for '{query}'...")
-        # Emit signal for parent to handle actual search
+        # Parent runs the search, passing the selected types through to
+        # SearchService.global_search so unselected types are never queried
+        self.search_requested.emit(query, entity_types)
     
     def load_results(self, results: List[SearchResult]):
         """Load search results into the table.
         
+        Rows are inserted in batches of ``RESULTS_CHUNK_SIZE`` so the event
+        loop can process paints and input between batches on large result sets.
+        
         Args:
             results: List of SearchResult objects
         """
+        self._chunk_timer.stop()
         self.results_table.setRowCount(0)
+        self._pending_results = list(results)
+        self._results_cursor = 0
         
-        if not results:
+        if not self._pending_results:
             self.results_label.setText("No results found.")
             return
         
-        self.results_label.setText(f"Found {len(results)} result(s)")
-        
-        for result in results:
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-            
-            # Entity type
-            type_item = QTableWidgetItem(result.entity_type.replace('_', ' ').title())
-            type_item.setData(Qt.ItemDataRole.UserRole, result)
-            self.results_table.setItem(row, 0, type_item)
-            
-            # Entity name/title
-            name = self._get_entity_display_name(result.entity)
-            name_item = QTableWidgetItem(name)
-            name_item.setFont(QFont("", weight=QFont.Weight.Bold))
-            self.results_table.setItem(row, 1, name_item)
-            
-            # Matched field
-            field_item = QTableWidgetItem(result.matched_field)
-            self.results_table.setItem(row, 2, field_item)
-            
-            # Match snippet
-            snippet_item = QTableWidgetItem(result.match_snippet)
-            self.results_table.setItem(row, 3, snippet_item)
+        self._load_next_chunk()
+    
+    def _load_next_chunk(self):
+        """Insert the next batch of pending results into the table."""
+        total = len(self._pending_results)
+        start = self._results_cursor
+        end = min(start + self.RESULTS_CHUNK_SIZE, total)
+        
+        self.results_table.setUpdatesEnabled(False)
+        try:
+            self.results_table.setRowCount(end)
+            for row in range(start, end):
+                result = self._pending_results[row]
+                
+                # Entity type
+                type_item = QTableWidgetItem(result.entity_type.replace('_', ' ').title())
+                type_item.setData(Qt.ItemDataRole.UserRole, result)
+                self.results_table.setItem(row, 0, type_item)
+                
+                # Entity name/title
+                name = self._get_entity_display_name(result.entity)
+                name_item = QTableWidgetItem(name)
+                name_item.setFont(QFont("", weight=QFont.Weight.Bold))
+                self.results_table.setItem(row, 1, name_item)
+                
+                # Matched field
+                field_item = QTableWidgetItem(result.matched_field)
+                self.results_table.setItem(row, 2, field_item)
+                
+                # Match snippet
+                snippet = result.match_snippet
+                if len(snippet) > self.MAX_SNIPPET_LENGTH:
+                    snippet = snippet[:self.MAX_SNIPPET_LENGTH - 3] + "..."
+                snippet_item = QTableWidgetItem(snippet)
+                self.results_table.setItem(row, 3, snippet_item)
+        finally:
+            self.results_table.setUpdatesEnabled(True)
+        
+        self._results_cursor = end
+        if end < total:
+            self.results_label.setText(f"Loaded {end}/{total}...")
+            self._chunk_timer.start()
+        else:
+            self.results_label.setText(f"Found {total} result(s)")
     
     def _get_entity_display_name(self, entity) -> str:
         """Get display name for an entity."""
@@ -188,7 +258,8 @@ class SearchWidget(QWidget):
         Returns:
             List of entity type names
         """
-        return [name for name, check in self.filter_checks.items() if check.isChecked()]
+        return [name for name, check in zip(self._filter_names, self._filter_checks)
+                if check.isChecked()]
     
     def _get_selected_result(self) -> SearchResult:
         """Get the selected search result.
@@ -224,6 +295,9 @@ class SearchWidget(QWidget):
     def _clear_search(self):
         """Clear search input and results."""
         self.search_input.clear()
+        self._last_key = None
+        self._chunk_timer.stop()
+        self._pending_results = []
         self.results_table.setRowCount(0)
         self.results_label.setText("Enter search query...")
         self.view_button.setEnabled(False)
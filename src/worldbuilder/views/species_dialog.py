@@ -8,6 +8,11 @@ from worldbuilder.enums import SpeciesType
 import json
 
 
+# Combo box entries and their indices, built once at import
+_SPECIES_TYPE_ITEMS = [(t.value, t) for t in SpeciesType]
+_SPECIES_TYPE_INDEX = {t: i for i, (_, t) in enumerate(_SPECIES_TYPE_ITEMS)}
+
+
 class SpeciesDialog(QDialog):
     """Dialog for creating or editing a species."""
     
@@ -57,8 +62,8 @@ class SpeciesDialog(QDialog):
         
         # Species type
         self.type_combo = QComboBox()
-        for sp_type in SpeciesType:
-            self.type_combo.addItem(sp_type.value, sp_type)
+        for label, sp_type in _SPECIES_TYPE_ITEMS:
+            self.type_combo.addItem(label, sp_type)
         basic_layout.addRow("Type:", self.type_combo)
         
         # Playable checkbox
@@ -158,10 +163,9 @@ class SpeciesDialog(QDialog):
         self.name_edit.setText(self.species.name)
         
         # Set type
-        for i in range(self.type_combo.count()):
-            if self.type_combo.itemData(i) == self.species.species_type:
-                self.type_combo.setCurrentIndex(i)
-                break
+        type_index = _SPECIES_TYPE_INDEX.get(self.species.species_type)
+        if type_index is not None:
+            self.type_combo.setCurrentIndex(type_index)
         
         self.playable_check.setChecked(self.species.is_playable)
         
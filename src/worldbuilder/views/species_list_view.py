@@ -1,11 +1,39 @@
 """Species list view widget."""
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QTableWidget, QTableWidgetItem, QHeaderView, QLabel)
-from PyQt6.QtCore import pyqtSignal, Qt
+                             QTableView, QHeaderView, QLabel)
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
 from worldbuilder.models.species import Species
+from worldbuilder.views.entity_table_model import EntityTableModel
 from typing import List
 
 
+_ALIGN_C = Qt.AlignmentFlag.AlignCenter
+
+
+class SpeciesTableModel(EntityTableModel):
+    """Table model for the species list."""
+    
+    HEADERS = ["Name", "Type", "Playable", "Description"]
+    COLUMNS = ("name", "species_type", "is_playable", "description")
+    
+    def _display_text(self, species: Species, column: int) -> str:
+        if column == 1:
+            return species.species_type.value
+        if column == 2:
+            return "Yes" if species.is_playable else "No"
+        if column == 3:
+            # Single line, plain text: keeps the row at its fixed height
+            if not species.description:
+                return ""
+            return species.description[:100].replace("\n", " ")
+        return super()._display_text(species, column)
+    
+    def _alignment(self, species: Species, column: int):
+        if column == 2:
+            return _ALIGN_C
+        return None
+
+
 class SpeciesListView(QWidget):
     """Widget displaying a list of species."""
     
@@ -17,6 +45,9 @@ class SpeciesListView(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Selection is emitted at most once per event-loop pass
+        self._pending_selection_id = None
+        self._selection_emit_scheduled = False
         self._setup_ui()
     
     def _setup_ui(self):
@@ -38,22 +69,30 @@ class SpeciesListView(QWidget):
         layout.addLayout(header_layout)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Name", "Type", "Playable", "Description"])
+        self.model = SpeciesTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         
         # Configure table
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        # Fixed starting widths: ResizeToContents would measure every row on each load
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)
         self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        self.table.setColumnWidth(0, 160)
+        self.table.setColumnWidth(1, 100)
+        self.table.setColumnWidth(2, 80)
+        
+        # Uniform row heights: no per-row measuring pass on layout
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(24)
         
         # Connect signals
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
-        self.table.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.table.doubleClicked.connect(self._on_item_double_clicked)
         
         layout.addWidget(self.table)
         
@@ -80,30 +119,18 @@ class SpeciesListView(QWidget):
         Args:
             species_list: List of Species entities
         """
-        self.table.setRowCount(0)
-        
-        for species in species_list:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # ID (hidden data)
-            name_item = QTableWidgetItem(species.name)
-            name_item.setData(Qt.ItemDataRole.UserRole, species.id)
-            self.table.setItem(row, 0, name_item)
-            
-            # Type
-            type_item = QTableWidgetItem(species.species_type.value)
-            self.table.setItem(row, 1, type_item)
-            
-            # Playable
-            playable_item = QTableWidgetItem("Yes" if species.is_playable else "No")
-            playable_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 2, playable_item)
-            
-            # Description
-            desc_text = (species.description or "")[:100]
-            desc_item = QTableWidgetItem(desc_text)
-            self.table.setItem(row, 3, desc_item)
+        # Clear selection up front, then keep the row changes from emitting
+        # selection updates one by one; button state is refreshed once at the end
+        self.table.clearSelection()
+        selection_model = self.table.selectionModel()
+        selection_model.blockSignals(True)
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.update_rows(species_list)
+        finally:
+            selection_model.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+            self._on_selection_changed()
     
     def get_selected_species_id(self) -> int:
         """Get the ID of the selected species.
@@ -111,25 +138,31 @@ class SpeciesListView(QWidget):
         Returns:
             Species ID or None if no selection
         """
-        selected_items = self.table.selectedItems()
-        if not selected_items:
+        selected_rows = self.table.selectionModel().selectedRows()
+        if not selected_rows:
             return None
         
-        row = selected_items[0].row()
-        id_item = self.table.item(row, 0)
-        return id_item.data(Qt.ItemDataRole.UserRole)
+        species = self.model.entity_at(selected_rows[0].row())
+        return species.id if species else None
     
     def _on_selection_changed(self):
         """Handle selection change."""
-        has_selection = len(self.table.selectedItems()) > 0
+        has_selection = self.table.selectionModel().hasSelection()
         self.edit_button.setEnabled(has_selection)
         self.delete_button.setEnabled(has_selection)
         
-        if has_selection:
-            species_id = self.get_selected_species_id()
-            self.species_selected.emit(species_id)
+        self._pending_selection_id = self.get_selected_species_id() if has_selection else None
+        if has_selection and not self._selection_emit_scheduled:
+            self._selection_emit_scheduled = True
+            QTimer.singleShot(0, self._emit_pending_selection)
+    
+    def _emit_pending_selection(self):
+        """Emit the latest selection once queued selection changes settle."""
+        self._selection_emit_scheduled = False
+        if self._pending_selection_id is not None:
+            self.species_selected.emit(self._pending_selection_id)
     
-    def _on_item_double_clicked(self, item):
+    def _on_item_double_clicked(self, index):
         """Handle item double click - edit species."""
         species_id = self.get_selected_species_id()
         if species_id:
@@ -1,9 +1,10 @@
 """Universe details panel widget."""
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, 
                              QScrollArea, QFrame, QGroupBox)
 from PyQt6.QtCore import Qt, pyqtSignal
 from worldbuilder.models.universe import Universe
 from datetime import datetime
+from html import escape
 
 
 class UniverseDetailsPanel(QWidget):
@@ -14,6 +15,7 @@ class UniverseDetailsPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._current_universe = None
+        self._displayed_key = None  # (id, updated_at) of the universe on display
         self._setup_ui()
     
     def _setup_ui(self):
@@ -50,15 +52,8 @@ class UniverseDetailsPanel(QWidget):
         basic_group = QGroupBox("Basic Information")
         basic_layout = QVBoxLayout()
         
-        self.name_label = self._create_info_row("Name:", "")
-        self.author_label = self._create_info_row("Author:", "")
-        self.genre_label = self._create_info_row("Genre:", "")
-        self.status_label = self._create_info_row("Status:", "")
-        
-        basic_layout.addWidget(self.name_label[0])
-        basic_layout.addWidget(self.author_label[0])
-        basic_layout.addWidget(self.genre_label[0])
-        basic_layout.addWidget(self.status_label[0])
+        self.basic_info_label = self._create_info_label()
+        basic_layout.addWidget(self.basic_info_label)
         basic_group.setLayout(basic_layout)
         details_layout.addWidget(basic_group)
         
@@ -78,13 +73,8 @@ class UniverseDetailsPanel(QWidget):
         meta_group = QGroupBox("Metadata")
         meta_layout = QVBoxLayout()
         
-        self.id_label = self._create_info_row("ID:", "")
-        self.created_label = self._create_info_row("Created:", "")
-        self.updated_label = self._create_info_row("Updated:", "")
-        
-        meta_layout.addWidget(self.id_label[0])
-        meta_layout.addWidget(self.created_label[0])
-        meta_layout.addWidget(self.updated_label[0])
+        self.meta_info_label = self._create_info_label()
+        meta_layout.addWidget(self.meta_info_label)
         meta_group.setLayout(meta_layout)
         details_layout.addWidget(meta_group)
         
@@ -96,41 +86,47 @@ class UniverseDetailsPanel(QWidget):
         scroll.setWidget(container)
         layout.addWidget(scroll)
     
-    def _create_info_row(self, label_text: str, value_text: str):
-        """Create an information row with label and value."""
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 2, 0, 2)
-        
-        label = QLabel(label_text)
-        label.setStyleSheet("font-weight: bold; min-width: 80px;")
-        
-        value = QLabel(value_text)
-        value.setWordWrap(True)
-        value.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        
-        layout.addWidget(label)
-        layout.addWidget(value, 1)
-        
-        return (container, label, value)
+    def _create_info_label(self) -> QLabel:
+        """Create a rich-text label holding a group of "Field: value" rows."""
+        label = QLabel()
+        label.setTextFormat(Qt.TextFormat.RichText)
+        label.setWordWrap(True)
+        label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        label.setStyleSheet("padding: 2px 0;")
+        return label
+    
+    def _format_info_rows(self, rows) -> str:
+        """Format (field, value) pairs as rich-text lines."""
+        return "<br>".join(f"<b>{field}:</b> {escape(value)}" for field, value in rows)
     
     def set_universe(self, universe: Universe):
         """Display details for the given universe."""
         self._current_universe = universe
         
         if universe is None:
+            self._displayed_key = None
             self.empty_label.setVisible(True)
             self.details_widget.setVisible(False)
             return
         
+        # Skip relayout when the same, unmodified universe is shown again.
+        # The key is captured at display time because the session hands back
+        # the same (possibly since-edited) instance.
+        key = (universe.id, universe.updated_at)
+        if key == self._displayed_key:
+            return
+        self._displayed_key = key
+        
         self.empty_label.setVisible(False)
         self.details_widget.setVisible(True)
         
         # Update basic info
-        self.name_label[2].setText(universe.name)
-        self.author_label[2].setText(universe.author or "Not specified")
-        self.genre_label[2].setText(universe.genre or "Not specified")
-        self.status_label[2].setText("Active" if universe.is_active else "Inactive")
+        self.basic_info_label.setText(self._format_info_rows([
+            ("Name", universe.name),
+            ("Author", universe.author or "Not specified"),
+            ("Genre", universe.genre or "Not specified"),
+            ("Status", "Active" if universe.is_active else "Inactive")
+        ]))
         
         # Update description
         if universe.description:
@@ -139,9 +135,11 @@ class UniverseDetailsPanel(QWidget):
             self.description_label.setText("<i>No description provided</i>")
         
         # Update metadata
-        self.id_label[2].setText(str(universe.id))
-        self.created_label[2].setText(self._format_datetime(universe.created_at))
-        self.updated_label[2].setText(self._format_datetime(universe.updated_at))
+        self.meta_info_label.setText(self._format_info_rows([
+            ("ID", str(universe.id)),
+            ("Created", self._format_datetime(universe.created_at)),
+            ("Updated", self._format_datetime(universe.updated_at))
+        ]))
     
     def clear(self):
         """Clear the details panel."""
@@ -151,4 +149,5 @@ class UniverseDetailsPanel(QWidget):
         """Format datetime for display."""
         if dt is None:
             return "Unknown"
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+                f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}")
@@ -24,6 +24,9 @@ class UniverseDialog(QDialog):
         "Other"
     ]
     
+    # Genre -> combo index, so loading a universe is a dict lookup
+    _GENRE_INDEX = {genre: index for index, genre in enumerate(GENRES)}
+    
     def __init__(self, parent=None, universe: Universe = None):
         """Initialize the dialog.
         
@@ -39,7 +42,26 @@ class UniverseDialog(QDialog):
         self.setModal(True)
         self.setMinimumWidth(500)
         
+        # A new universe starts from an empty form, so building it can wait
+        # until the dialog is first shown
+        self._built = False
+        if self.is_edit_mode:
+            self._ensure_ui()
+    
+    def showEvent(self, event):
+        """Build the form the first time the dialog is shown."""
+        if not self._built:
+            self._ensure_ui()
+            self.adjustSize()
+        super().showEvent(event)
+    
+    def _ensure_ui(self):
+        """Build the form widgets and load universe data if not done yet."""
+        if self._built:
+            return
+        
         self._setup_ui()
+        self._built = True
         
         if self.is_edit_mode:
             self._load_universe_data()
@@ -105,8 +127,8 @@ class UniverseDialog(QDialog):
             self.author_edit.setText(self.universe.author)
         
         if self.universe.genre:
-            index = self.genre_combo.findText(self.universe.genre)
-            if index >= 0:
+            index = self._GENRE_INDEX.get(self.universe.genre)
+            if index is not None:
                 self.genre_combo.setCurrentIndex(index)
         
         if self.universe.description:
@@ -130,6 +152,8 @@ class UniverseDialog(QDialog):
         Returns:
             Dictionary with universe data
         """
+        self._ensure_ui()
+        
         genre = self.genre_combo.currentText()
         if not genre or genre == "":
             genre = None
@@ -1,10 +1,38 @@
 """Universe management view showing list of universes."""
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QTableWidget, QTableWidgetItem, QHeaderView, 
-                             QMessageBox, QLabel)
-from PyQt6.QtCore import pyqtSignal, Qt
+                             QTableView, QHeaderView, QMessageBox, QLabel)
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
+from PyQt6.QtGui import QColor
 from worldbuilder.models.universe import Universe
-from typing import List
+from worldbuilder.views.entity_table_model import EntityTableModel
+from typing import Callable, Iterable, List
+
+
+# Shared cell styling, built once instead of per painted cell
+_ALIGN_C = Qt.AlignmentFlag.AlignCenter
+_DARKGREEN = QColor(Qt.GlobalColor.darkGreen)
+
+
+class UniverseTableModel(EntityTableModel):
+    """Table model for the universe list."""
+    
+    HEADERS = ["ID", "Name", "Author", "Genre", "Status"]
+    COLUMNS = ("id", "name", "author", "genre", "is_active")
+    
+    def _display_text(self, universe: Universe, column: int) -> str:
+        if column == 4:
+            return "Active" if universe.is_active else "Inactive"
+        return super()._display_text(universe, column)
+    
+    def _alignment(self, universe: Universe, column: int):
+        if column in (0, 4):
+            return _ALIGN_C
+        return None
+    
+    def _foreground(self, universe: Universe, column: int):
+        if column == 4 and universe.is_active:
+            return _DARKGREEN
+        return None
 
 
 class UniverseListView(QWidget):
@@ -19,6 +47,9 @@ class UniverseListView(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Selection is emitted at most once per event-loop pass
+        self._pending_selection_id = None
+        self._selection_emit_scheduled = False
         self._setup_ui()
     
     def _setup_ui(self):
@@ -40,14 +71,14 @@ class UniverseListView(QWidget):
         layout.addLayout(header_layout)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["ID", "Name", "Author", "Genre", "Status"])
+        self.model = UniverseTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         
         # Configure table
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.horizontalHeader().setStretchLastSection(False)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.table.setColumnWidth(0, 50)
@@ -55,9 +86,13 @@ class UniverseListView(QWidget):
         self.table.setColumnWidth(3, 120)
         self.table.setColumnWidth(4, 80)
         
+        # Uniform row heights: no per-row measuring pass on layout
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(24)
+        
         # Connect signals
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
-        self.table.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.table.doubleClicked.connect(self._on_item_double_clicked)
         
         layout.addWidget(self.table)
         
@@ -89,35 +124,36 @@ class UniverseListView(QWidget):
         Args:
             universes: List of Universe entities
         """
-        self.table.setRowCount(0)
-        
-        for universe in universes:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # ID
-            id_item = QTableWidgetItem(str(universe.id))
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 0, id_item)
-            
-            # Name
-            name_item = QTableWidgetItem(universe.name)
-            self.table.setItem(row, 1, name_item)
-            
-            # Author
-            author_item = QTableWidgetItem(universe.author or "")
-            self.table.setItem(row, 2, author_item)
-            
-            # Genre
-            genre_item = QTableWidgetItem(universe.genre or "")
-            self.table.setItem(row, 3, genre_item)
-            
-            # Status
-            status_item = QTableWidgetItem("Active" if universe.is_active else "Inactive")
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if universe.is_active:
-                status_item.setForeground(Qt.GlobalColor.darkGreen)
-            self.table.setItem(row, 4, status_item)
+        # Clear selection up front, then keep the row changes from emitting
+        # selection updates one by one; button state is refreshed once at the end
+        self.table.clearSelection()
+        selection_model = self.table.selectionModel()
+        selection_model.blockSignals(True)
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.update_rows(universes)
+        finally:
+            selection_model.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+            self._on_selection_changed()
+    
+    def load_universes_from_query(self, query_callable: Callable[[], Iterable[Universe]]) -> List[Universe]:
+        """Load universes from a single query call.
+        
+        The callable is invoked once and fully materialized before the model is
+        touched, so a refresh costs one query in the caller's session rather
+        than lazy per-row fetches while the view paints.
+        
+        Args:
+            query_callable: Callable returning the universes to display,
+                e.g. ``UniverseService.get_all_universes``
+        
+        Returns:
+            The loaded universes
+        """
+        universes = list(query_callable())
+        self.load_universes(universes)
+        return universes
     
     def get_selected_universe_id(self) -> int:
         """Get the ID of the selected universe.
@@ -125,26 +161,32 @@ class UniverseListView(QWidget):
         Returns:
             Universe ID or None if no selection
         """
-        selected_rows = self.table.selectedItems()
+        selected_rows = self.table.selectionModel().selectedRows()
         if not selected_rows:
             return None
         
-        row = selected_rows[0].row()
-        id_item = self.table.item(row, 0)
-        return int(id_item.text())
+        universe = self.model.entity_at(selected_rows[0].row())
+        return universe.id if universe else None
     
     def _on_selection_changed(self):
         """Handle selection change."""
-        has_selection = len(self.table.selectedItems()) > 0
+        has_selection = self.table.selectionModel().hasSelection()
         self.open_button.setEnabled(has_selection)
         self.edit_button.setEnabled(has_selection)
         self.delete_button.setEnabled(has_selection)
         
-        if has_selection:
-            universe_id = self.get_selected_universe_id()
-            self.universe_selected.emit(universe_id)
+        self._pending_selection_id = self.get_selected_universe_id() if has_selection else None
+        if has_selection and not self._selection_emit_scheduled:
+            self._selection_emit_scheduled = True
+            QTimer.singleShot(0, self._emit_pending_selection)
+    
+    def _emit_pending_selection(self):
+        """Emit the latest selection once queued selection changes settle."""
+        self._selection_emit_scheduled = False
+        if self._pending_selection_id is not None:
+            self.universe_selected.emit(self._pending_selection_id)
     
-    def _on_item_double_clicked(self, item):
+    def _on_item_double_clicked(self, index):
         """Handle item double click - open universe."""
         universe_id = self.get_selected_universe_id()
         if universe_id:
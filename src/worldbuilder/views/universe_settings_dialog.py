@@ -9,6 +9,41 @@ from worldbuilder.models.universe import Universe
 class UniverseSettingsDialog(QDialog):
     """Dialog for configuring universe-specific settings."""
     
+    # Static combo box options, allocated once per process
+    _CALENDAR_TYPES = (
+        "Gregorian (Earth Standard)",
+        "Custom Calendar",
+        "No Calendar System"
+    )
+    
+    _TIMELINE_UNITS = (
+        "Standard Years",
+        "Custom Era System",
+        "Before/After Event"
+    )
+    
+    _DEFAULT_SORTS = (
+        "Name (A-Z)",
+        "Name (Z-A)",
+        "Date Created (Newest)",
+        "Date Created (Oldest)",
+        "Last Modified"
+    )
+    
+    # Values reported by get_settings before the form has been built
+    _DEFAULT_SETTINGS = {
+        'calendar_type': _CALENDAR_TYPES[0],
+        'days_per_week': 7,
+        'months_per_year': 12,
+        'days_per_year': 365,
+        'timeline_unit': _TIMELINE_UNITS[0],
+        'enable_negative_dates': True,
+        'show_entity_count': True,
+        'default_sort': _DEFAULT_SORTS[0],
+        'auto_backup': False,
+        'backup_frequency_days': 7
+    }
+    
     def __init__(self, parent=None, universe: Universe = None):
         """Initialize the dialog.
         
@@ -24,10 +59,24 @@ class UniverseSettingsDialog(QDialog):
         self.setMinimumWidth(600)
         self.setMinimumHeight(500)
         
+        # The form is built on first show so creating the dialog stays cheap
+        self._built = False
+    
+    def showEvent(self, event):
+        """Build the form the first time the dialog is shown."""
+        if not self._built:
+            self._build_ui()
+        super().showEvent(event)
+    
+    def _build_ui(self):
+        """Create the form widgets and load the universe's settings."""
         self._setup_ui()
+        self._built = True
         
         if self.universe:
             self._load_settings()
+        
+        self.adjustSize()
     
     def _setup_ui(self):
         """Set up the dialog UI."""
@@ -38,26 +87,22 @@ class UniverseSettingsDialog(QDialog):
         calendar_layout = QFormLayout()
         
         self.calendar_type_combo = QComboBox()
-        self.calendar_type_combo.addItems([
-            "Gregorian (Earth Standard)",
-            "Custom Calendar",
-            "No Calendar System"
-        ])
+        self.calendar_type_combo.addItems(self._CALENDAR_TYPES)
         calendar_layout.addRow("Calendar Type:", self.calendar_type_combo)
         
         self.days_per_week_spin = QSpinBox()
         self.days_per_week_spin.setRange(1, 20)
-        self.days_per_week_spin.setValue(7)
+        self.days_per_week_spin.setValue(self._DEFAULT_SETTINGS['days_per_week'])
         calendar_layout.addRow("Days per Week:", self.days_per_week_spin)
         
         self.months_per_year_spin = QSpinBox()
         self.months_per_year_spin.setRange(1, 30)
-        self.months_per_year_spin.setValue(12)
+        self.months_per_year_spin.setValue(self._DEFAULT_SETTINGS['months_per_year'])
         calendar_layout.addRow("Months per Year:", self.months_per_year_spin)
         
         self.days_per_year_spin = QSpinBox()
         self.days_per_year_spin.setRange(1, 1000)
-        self.days_per_year_spin.setValue(365)
+        self.days_per_year_spin.setValue(self._DEFAULT_SETTINGS['days_per_year'])
         calendar_layout.addRow("Days per Year:", self.days_per_year_spin)
         
         calendar_group.setLayout(calendar_layout)
@@ -68,15 +113,11 @@ class UniverseSettingsDialog(QDialog):
         timeline_layout = QFormLayout()
         
         self.timeline_unit_combo = QComboBox()
-        self.timeline_unit_combo.addItems([
-            "Standard Years",
-            "Custom Era System",
-            "Before/After Event"
-        ])
+        self.timeline_unit_combo.addItems(self._TIMELINE_UNITS)
         timeline_layout.addRow("Timeline Unit:", self.timeline_unit_combo)
         
         self.enable_negative_dates = QCheckBox("Allow dates before year 0")
-        self.enable_negative_dates.setChecked(True)
+        self.enable_negative_dates.setChecked(self._DEFAULT_SETTINGS['enable_negative_dates'])
         timeline_layout.addRow("", self.enable_negative_dates)
         
         timeline_group.setLayout(timeline_layout)
@@ -87,17 +128,11 @@ class UniverseSettingsDialog(QDialog):
         display_layout = QFormLayout()
         
         self.show_entity_count = QCheckBox("Show entity counts")
-        self.show_entity_count.setChecked(True)
+        self.show_entity_count.setChecked(self._DEFAULT_SETTINGS['show_entity_count'])
         display_layout.addRow("", self.show_entity_count)
         
         self.default_sort_combo = QComboBox()
-        self.default_sort_combo.addItems([
-            "Name (A-Z)",
-            "Name (Z-A)",
-            "Date Created (Newest)",
-            "Date Created (Oldest)",
-            "Last Modified"
-        ])
+        self.default_sort_combo.addItems(self._DEFAULT_SORTS)
         display_layout.addRow("Default Sort:", self.default_sort_combo)
         
         display_group.setLayout(display_layout)
@@ -108,12 +143,12 @@ class UniverseSettingsDialog(QDialog):
         data_layout = QFormLayout()
         
         self.auto_backup = QCheckBox("Enable automatic backups")
-        self.auto_backup.setChecked(False)
+        self.auto_backup.setChecked(self._DEFAULT_SETTINGS['auto_backup'])
         data_layout.addRow("", self.auto_backup)
         
         self.backup_frequency_spin = QSpinBox()
         self.backup_frequency_spin.setRange(1, 30)
-        self.backup_frequency_spin.setValue(7)
+        self.backup_frequency_spin.setValue(self._DEFAULT_SETTINGS['backup_frequency_days'])
         self.backup_frequency_spin.setSuffix(" days")
         self.backup_frequency_spin.setEnabled(False)
         data_layout.addRow("Backup Every:", self.backup_frequency_spin)
@@ -167,6 +202,9 @@ class UniverseSettingsDialog(QDialog):
         Returns:
             Dictionary with settings
         """
+        if not self._built:
+            return dict(self._DEFAULT_SETTINGS)
+        
         return {
             'calendar_type': self.calendar_type_combo.currentText(),
             'days_per_week': self.days_per_week_spin.value(),
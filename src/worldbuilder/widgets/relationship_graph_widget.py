@@ -7,21 +7,79 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QComboBox, 
     QLabel, QCheckBox, QToolBar, QSlider, QGroupBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+from networkx.algorithms.community import louvain_communities
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache
 from typing import List, Optional, Set
 
 
+@lru_cache(maxsize=None)
+def _kdtree_class():
+    """Import scipy's cKDTree on the first hit-test, keeping scipy.spatial off startup.
+    
+    Returns None without scipy; hit-testing then falls back to a NumPy scan.
+    """
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:  # scipy is optional
+        return None
+    return cKDTree
+
+
+@lru_cache(maxsize=None)
+def _fr_layout_module():
+    """Import the layout kernel module on first use; importing numba is slow."""
+    from worldbuilder.widgets import _fr_layout
+    return _fr_layout
+
+
+# Node colors by entity type name
+_TYPE_COLORS = {
+    'NotableFigure': 'skyblue',
+    'Location': 'lightgreen',
+    'Organization': 'lightcoral',
+    'Artifact': 'plum',
+    'Species': 'wheat',
+    'Community': 'lightsteelblue',
+}
+
+# Edge colors by lowercase relationship type
+_RELATIONSHIP_COLORS = {
+    'family': 'green',
+    'friend': 'blue',
+    'enemy': 'red',
+    'ally': 'purple',
+    'romantic': 'pink',
+    'professional': 'orange',
+    'mentor': 'brown',
+    'rival': 'darkred',
+}
+
+
 class RelationshipGraphCanvas(FigureCanvas):
     """
     Matplotlib-based canvas for rendering relationship graphs using NetworkX.
     """
     node_clicked = pyqtSignal(object)  # Emits entity object
     
+    # Graphs at least this large use the compiled kernel for the spring layout;
+    # below it NetworkX's solver finishes in a few tens of milliseconds
+    COMPILED_LAYOUT_MIN_NODES = 150
+    
+    # Unfocused graphs with more entities than this are drawn one node per community
+    COMMUNITY_THRESHOLD = 200
+    
+    # Number of computed layouts kept for reuse when toggling back
+    LAYOUT_CACHE_SIZE = 8
+    
     def __init__(self, parent=None, width=10, height=8, dpi=100):
         self.fig = Figure(figsize=(width, height), dpi=dpi)
         self.axes = self.fig.add_subplot(111)
@@ -32,37 +90,135 @@ class RelationshipGraphCanvas(FigureCanvas):
         self.entities = []
         self.relationships = []
         self.entity_types = set()
+        self._ent_index = {}  # Entity ID -> row in self.entities
+        self._type_names = []  # Entity type name for each type code
+        self._ent_types = np.zeros(0, dtype=np.int16)  # Type code per entity row
+        self._edge_rels = []  # Relationships whose endpoints are both loaded
+        self._edges = np.zeros((0, 2), dtype=np.int64)  # Entity rows per edge
+        self._edge_types = []  # Lowercase relationship type per edge
+        self._edge_weights = np.zeros(0, dtype=np.float32)  # Strength per edge
+        self._adj = defaultdict(list)  # Entity ID -> indices of edges touching it
         self.filtered_types = set()
         self.layout_algorithm = 'spring'
         self.show_labels = True
         self.focused_entity_id = None
-        
-        # Connect click event
+        self._community_map = {}  # Community node ID -> set of member entity IDs
+        self._expanded_members = None  # Entity IDs of the expanded community, if any
+        self._pos = None  # Node positions from the last layout pass
+        self._layout_cache = OrderedDict()  # (algorithm, nodes, edges) -> positions
+        self._seed_pos = None  # Last drawn positions, kept across layout changes
+        self._node_ids = []  # Node IDs in the row order of _pos_array
+        self._pos_array = None  # (N, 2) array of node positions for hit-testing
+        self._kdtree = None  # Spatial index over _pos_array, built on the first hit-test
+        self._background = None  # Axes pixels from the last full draw, for blitting
+        self._hover_artist = None  # Animated ring drawn around the hovered node
+        self._hovered_node = None
+        self._legend = None  # Entity type legend from the last draw
+        self._legend_types = None  # Entity types shown in _legend
+        
+        # Connect mouse and draw events
         self.mpl_connect('button_press_event', self._on_click)
+        self.mpl_connect('motion_notify_event', self._on_motion)
+        self.mpl_connect('draw_event', self._on_draw)
         
     def set_data(self, entities: List, relationships: List):
         """Set entities and relationships to visualize."""
-        self.entities = entities or []
-        self.relationships = relationships or []
+        self._store_data(entities, relationships)
+        self._expanded_members = None
+        self._layout_cache.clear()
+        self._seed_pos = None
+        self.build_graph()
+        self.render_graph()
         
-        # Extract entity types
-        self.entity_types = set()
-        for entity in self.entities:
-            entity_type = type(entity).__name__
-            self.entity_types.add(entity_type)
+    def update_data(self, entities: List, relationships: List):
+        """Replace entities and relationships, keeping existing node positions.
         
+        Nodes that were already laid out stay where they are and only new
+        nodes are placed, by warm-starting the spring layout from the previous
+        positions. Other layout algorithms are cheap and are simply rerun.
+        """
+        previous_pos = self._pos
+        self._store_data(entities, relationships)
         self.build_graph()
-        self.render_graph()
         
-    def set_layout(self, algorithm: str):
-        """Set graph layout algorithm."""
-        self.layout_algorithm = algorithm
+        if previous_pos and self.layout_algorithm not in ('circular', 'kamada_kawai', 'shell'):
+            kept_ids = [node_id for node_id in self.graph if node_id in previous_pos]
+            if kept_ids:
+                seed = {node_id: previous_pos[node_id] for node_id in kept_ids}
+                if len(kept_ids) < self.graph.number_of_nodes():
+                    seed = nx.spring_layout(self.graph, pos=seed, fixed=kept_ids,
+                                            k=1, iterations=10)
+                self._set_positions(seed)
+        
         self.render_graph()
         
-    def set_show_labels(self, show: bool):
-        """Toggle node labels."""
+    def _store_data(self, entities: List, relationships: List):
+        """Store entities and relationships as parallel arrays for filtering."""
+        self.entities = entities or []
+        self.relationships = relationships or []
+        
+        # Entity rows and type codes, extracted once; graph rebuilds reuse them
+        entity_type_names = [type(entity).__name__ for entity in self.entities]
+        self.entity_types = set(entity_type_names)
+        self._type_names = sorted(self.entity_types)
+        type_codes = {name: code for code, name in enumerate(self._type_names)}
+        self._ent_index = {entity.id: row for row, entity in enumerate(self.entities)}
+        self._ent_types = np.fromiter((type_codes[name] for name in entity_type_names),
+                                      dtype=np.int16, count=len(entity_type_names))
+        
+        # Only relationships between loaded entities can become edges
+        ent_index = self._ent_index
+        self._edge_rels = [
+            rel for rel in self.relationships
+            if hasattr(rel, 'from_figure_id') and hasattr(rel, 'to_figure_id')
+            and rel.from_figure_id in ent_index and rel.to_figure_id in ent_index
+        ]
+        self._edges = np.array(
+            [(ent_index[rel.from_figure_id], ent_index[rel.to_figure_id]) for rel in self._edge_rels],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        self._edge_types = [(getattr(rel, 'type', None) or 'unknown').lower() for rel in self._edge_rels]
+        self._edge_weights = np.fromiter((getattr(rel, 'strength', 5) for rel in self._edge_rels),
+                                         dtype=np.float32, count=len(self._edge_rels))
+        
+        # Index edges by endpoint so focusing only visits the focused entity's edges
+        self._adj = defaultdict(list)
+        for i, rel in enumerate(self._edge_rels):
+            self._adj[rel.from_figure_id].append(i)
+            if rel.to_figure_id != rel.from_figure_id:
+                self._adj[rel.to_figure_id].append(i)
+        
+        # Only data this large can produce a graph that needs the compiled
+        # kernel (e.g. an expanded community), so compile it in the background now
+        if len(self.entities) >= self.COMPILED_LAYOUT_MIN_NODES:
+            _fr_layout_module().warm_up()
+        
+    def set_layout(self, algorithm: str, redraw: bool = True):
+        """Set graph layout algorithm.
+        
+        Args:
+            algorithm: Layout algorithm name
+            redraw: Render immediately; otherwise the next render_graph() call
+                computes the new layout
+        """
+        self.layout_algorithm = algorithm
+        self._clear_positions()
+        if redraw:
+            self.render_graph()
+        
+    def set_show_labels(self, show: bool, redraw: bool = True):
+        """Toggle node labels.
+        
+        Args:
+            show: Whether to draw node labels
+            redraw: Redraw immediately; otherwise the next render_graph() call
+                picks up the change
+        """
         self.show_labels = show
-        self.render_graph()
+        if redraw:
+            # Labels don't affect positions, so cached ones are reused; the
+            # layout only runs if an earlier deferred change cleared them
+            self.render_graph()
         
     def set_type_filter(self, filtered_types: Set[str]):
         """Filter graph by entity types."""
@@ -79,91 +235,120 @@ class RelationshipGraphCanvas(FigureCanvas):
     def clear_focus(self):
         """Clear entity focus and show full graph."""
         self.focused_entity_id = None
+        self._expanded_members = None
+        self.build_graph()
+        self.render_graph()
+        
+    def expand_community(self, community_id):
+        """Show the members of a community instead of the community overview."""
+        members = self._community_map.get(community_id)
+        if members is None:
+            return
+        self._expanded_members = members
         self.build_graph()
         self.render_graph()
         
     def build_graph(self):
         """Build NetworkX graph from entities and relationships."""
         self.graph = nx.Graph()
+        self._clear_positions()
         
         # Filter entities by type
-        filtered_entities = []
-        for entity in self.entities:
-            entity_type = type(entity).__name__
-            if not self.filtered_types or entity_type not in self.filtered_types:
-                filtered_entities.append(entity)
+        visible = np.ones(len(self.entities), dtype=bool)
+        if self.filtered_types:
+            hidden_codes = [code for code, name in enumerate(self._type_names)
+                            if name in self.filtered_types]
+            visible = ~np.isin(self._ent_types, hidden_codes)
+        
+        # An expanded community limits the overview to its members
+        if not self.focused_entity_id and self._expanded_members is not None:
+            members = self._expanded_members
+            visible &= np.fromiter((entity.id in members for entity in self.entities),
+                                   dtype=bool, count=len(self.entities))
+        
+        edges = self._edges
         
         # If focused on an entity, only show it and its connections
         if self.focused_entity_id:
-            # Find the focused entity
-            focused_entity = None
-            for entity in filtered_entities:
-                if entity.id == self.focused_entity_id:
-                    focused_entity = entity
-                    break
-            
-            if focused_entity:
-                # Add focused entity
-                self.graph.add_node(focused_entity.id, 
-                                   entity=focused_entity,
-                                   label=focused_entity.name,
-                                   type=type(focused_entity).__name__)
-                
-                # Add directly connected entities
-                connected_ids = set()
-                for rel in self.relationships:
-                    if hasattr(rel, 'from_figure_id') and hasattr(rel, 'to_figure_id'):
-                        if rel.from_figure_id == self.focused_entity_id:
-                            connected_ids.add(rel.to_figure_id)
-                        elif rel.to_figure_id == self.focused_entity_id:
-                            connected_ids.add(rel.from_figure_id)
-                
-                for entity in filtered_entities:
-                    if entity.id in connected_ids:
-                        self.graph.add_node(entity.id, 
-                                           entity=entity,
-                                           label=entity.name,
-                                           type=type(entity).__name__)
-                
-                # Add edges
-                for rel in self.relationships:
-                    if hasattr(rel, 'from_figure_id') and hasattr(rel, 'to_figure_id'):
-                        if (rel.from_figure_id == self.focused_entity_id or 
-                            rel.to_figure_id == self.focused_entity_id):
-                            if (self.graph.has_node(rel.from_figure_id) and 
-                                self.graph.has_node(rel.to_figure_id)):
-                                edge_attrs = {
-                                    'relationship': rel,
-                                    'type': getattr(rel, 'type', 'unknown'),
-                                    'weight': getattr(rel, 'strength', 5)
-                                }
-                                self.graph.add_edge(rel.from_figure_id, rel.to_figure_id, 
-                                                   **edge_attrs)
+            focus_row = self._ent_index.get(self.focused_entity_id)
+            if focus_row is None or not visible[focus_row]:
+                return
+            touching = np.array(self._adj.get(self.focused_entity_id, ()), dtype=np.int64)
+            touching_edges = edges[touching]
+            edge_indices = touching[visible[touching_edges[:, 0]] & visible[touching_edges[:, 1]]]
+            node_rows = np.unique(np.concatenate(([focus_row], edges[edge_indices].ravel())))
         else:
-            # Add all filtered entities as nodes
-            for entity in filtered_entities:
-                self.graph.add_node(entity.id, 
-                                   entity=entity,
-                                   label=entity.name,
-                                   type=type(entity).__name__)
-            
-            # Add relationships as edges
-            for rel in self.relationships:
-                if hasattr(rel, 'from_figure_id') and hasattr(rel, 'to_figure_id'):
-                    # Only add edge if both nodes exist
-                    if (self.graph.has_node(rel.from_figure_id) and 
-                        self.graph.has_node(rel.to_figure_id)):
-                        edge_attrs = {
-                            'relationship': rel,
-                            'type': getattr(rel, 'type', 'unknown'),
-                            'weight': getattr(rel, 'strength', 5)
-                        }
-                        self.graph.add_edge(rel.from_figure_id, rel.to_figure_id, 
-                                           **edge_attrs)
+            # Only keep edges whose endpoints are both visible
+            edge_indices = np.flatnonzero(visible[edges[:, 0]] & visible[edges[:, 1]])
+            node_rows = np.flatnonzero(visible)
+            if self._expanded_members is None and len(node_rows) > self.COMMUNITY_THRESHOLD:
+                self._build_community_graph(node_rows, edge_indices)
+                return
+        
+        # Add nodes
+        for row in node_rows:
+            entity = self.entities[row]
+            self.graph.add_node(entity.id, 
+                               entity=entity,
+                               label=entity.name,
+                               type=self._type_names[self._ent_types[row]])
+        
+        # Add relationships as edges
+        for i in edge_indices:
+            rel = self._edge_rels[i]
+            self.graph.add_edge(rel.from_figure_id, rel.to_figure_id, 
+                               relationship=rel,
+                               type=self._edge_types[i],
+                               weight=float(self._edge_weights[i]))
+        
+    def _build_community_graph(self, node_rows, edge_indices):
+        """Fill the graph with one node per community of related entities.
+        
+        Communities are found with Louvain modularity on the visible entities;
+        community nodes are sized by membership and linked by the number of
+        relationships between their members.
+        """
+        members_graph = nx.Graph()
+        members_graph.add_nodes_from(node_rows.tolist())
+        members_graph.add_edges_from(self._edges[edge_indices].tolist())
+        communities = louvain_communities(members_graph, seed=0)
+        
+        self._community_map = {}
+        community_of = {}
+        for index, rows in enumerate(communities):
+            community_id = ('community', index)
+            self._community_map[community_id] = {self.entities[row].id for row in rows}
+            for row in rows:
+                community_of[row] = index
+            self.graph.add_node(community_id,
+                               label=f"Group {index + 1} ({len(rows)})",
+                               type='Community',
+                               size=min(300 + 20 * len(rows), 2000))
+        
+        links = Counter()
+        for u, v in members_graph.edges():
+            cu, cv = community_of[u], community_of[v]
+            if cu != cv:
+                links[min(cu, cv), max(cu, cv)] += 1
+        for (cu, cv), count in links.items():
+            self.graph.add_edge(('community', cu), ('community', cv),
+                               type='unknown',
+                               weight=min(count, 10))
         
     def render_graph(self):
-        """Render the relationship graph."""
+        """Render the relationship graph, laying it out first if needed."""
+        if self._pos is None and self.graph.number_of_nodes():
+            self._layout_graph()
+        self._draw_graph()
+        
+    def _layout_graph(self):
+        """Compute and cache node positions for the current graph."""
+        self._set_positions(self._compute_layout())
+        
+    def _draw_graph(self):
+        """Draw the graph using the cached node positions."""
         self.axes.clear()
+        self._hover_artist = None
         
         if not self.graph.nodes():
             self.axes.text(0.5, 0.5, 'No relationships to display', 
@@ -171,24 +356,14 @@ class RelationshipGraphCanvas(FigureCanvas):
             self.draw()
             return
         
-        # Choose layout algorithm
-        if self.layout_algorithm == 'spring':
-            pos = nx.spring_layout(self.graph, k=1, iterations=50)
-        elif self.layout_algorithm == 'circular':
-            pos = nx.circular_layout(self.graph)
-        elif self.layout_algorithm == 'kamada_kawai':
-            pos = nx.kamada_kawai_layout(self.graph)
-        elif self.layout_algorithm == 'shell':
-            pos = nx.shell_layout(self.graph)
-        else:
-            pos = nx.spring_layout(self.graph)
+        pos_array = self._pos_array
+        node_index = {node_id: i for i, node_id in enumerate(self._node_ids)}
         
         # Get node colors based on entity type
         node_colors = []
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            entity_type = node_data.get('type', 'Unknown')
-            color = self._get_type_color(entity_type)
+        node_sizes = [size for _, size in self.graph.nodes(data='size', default=500)]
+        for node_id, entity_type in self.graph.nodes(data='type', default='Unknown'):
+            color = _TYPE_COLORS.get(entity_type, 'lightgray')
             
             # Highlight focused entity
             if node_id == self.focused_entity_id:
@@ -196,116 +371,211 @@ class RelationshipGraphCanvas(FigureCanvas):
             
             node_colors.append(color)
         
-        # Get edge colors based on relationship type
+        # Get edge endpoints, colors and widths based on relationship type
+        edge_rows = []
         edge_colors = []
         edge_widths = []
         for u, v, data in self.graph.edges(data=True):
+            edge_rows.append((node_index[u], node_index[v]))
+            
             rel_type = data.get('type', 'unknown')
-            color = self._get_relationship_color(rel_type)
+            color = _RELATIONSHIP_COLORS.get(rel_type, 'gray')
             edge_colors.append(color)
             
             weight = data.get('weight', 5)
             edge_widths.append(weight / 2.0)
         
-        # Draw graph
-        nx.draw_networkx_nodes(self.graph, pos, 
-                              node_color=node_colors,
-                              node_size=500,
-                              alpha=0.9,
-                              ax=self.axes)
-        
-        nx.draw_networkx_edges(self.graph, pos,
-                              edge_color=edge_colors,
-                              width=edge_widths,
-                              alpha=0.6,
-                              ax=self.axes)
+        # Draw all edges as one collection and all nodes as one scatter
+        if edge_rows:
+            segments = pos_array[np.array(edge_rows)]
+            self.axes.add_collection(LineCollection(segments,
+                                                    colors=edge_colors,
+                                                    linewidths=edge_widths,
+                                                    alpha=0.6,
+                                                    zorder=1))
+        
+        self.axes.scatter(pos_array[:, 0], pos_array[:, 1],
+                          c=node_colors,
+                          s=node_sizes,
+                          alpha=0.9,
+                          zorder=2)
         
         # Draw labels if enabled
         if self.show_labels:
-            labels = nx.get_node_attributes(self.graph, 'label')
-            nx.draw_networkx_labels(self.graph, pos, labels,
-                                   font_size=8,
-                                   ax=self.axes)
+            for (x, y), (_, label) in zip(pos_array, self.graph.nodes(data='label')):
+                self.axes.text(x, y, label, fontsize=8,
+                               ha='center', va='center', zorder=3)
         
         self.axes.set_title('Relationship Graph')
         self.axes.axis('off')
         
-        # Add legend for entity types
+        # Add legend for entity types, reusing the last one if the types match
         if self.entity_types:
-            legend_elements = []
-            for entity_type in sorted(self.entity_types):
-                color = self._get_type_color(entity_type)
-                legend_elements.append(plt.Line2D([0], [0], marker='o', color='w',
-                                                  markerfacecolor=color, markersize=8,
-                                                  label=entity_type))
-            self.axes.legend(handles=legend_elements, loc='upper left', fontsize=8)
+            if self._legend is not None and self._legend_types == self.entity_types:
+                self.axes.add_artist(self._legend)
+            else:
+                legend_elements = []
+                for entity_type in sorted(self.entity_types):
+                    color = _TYPE_COLORS.get(entity_type, 'lightgray')
+                    legend_elements.append(plt.Line2D([0], [0], marker='o', color='w',
+                                                      markerfacecolor=color, markersize=8,
+                                                      label=entity_type))
+                self._legend = self.axes.legend(handles=legend_elements, loc='upper left', fontsize=8)
+                self._legend_types = set(self.entity_types)
         
         self.draw()
         
-    def _get_type_color(self, entity_type: str) -> str:
-        """Get color for entity type."""
-        type_colors = {
-            'NotableFigure': 'skyblue',
-            'Location': 'lightgreen',
-            'Organization': 'lightcoral',
-            'Artifact': 'plum',
-            'Species': 'wheat',
-        }
-        return type_colors.get(entity_type, 'lightgray')
-        
-    def _get_relationship_color(self, rel_type: str) -> str:
-        """Get color for relationship type."""
-        rel_colors = {
-            'family': 'green',
-            'friend': 'blue',
-            'enemy': 'red',
-            'ally': 'purple',
-            'romantic': 'pink',
-            'professional': 'orange',
-            'mentor': 'brown',
-            'rival': 'darkred',
-        }
-        return rel_colors.get(rel_type.lower(), 'gray')
+    def _clear_positions(self):
+        """Drop cached node positions after the graph or layout changes."""
+        self._pos = None
+        self._node_ids = []
+        self._pos_array = None
+        self._kdtree = None
+        
+    def _set_positions(self, pos: dict):
+        """Cache node positions, including an array form for hit-testing."""
+        self._pos = pos
+        self._seed_pos = pos
+        self._node_ids = list(self.graph.nodes())
+        self._pos_array = np.array([pos[node_id] for node_id in self._node_ids], dtype=float)
+        self._kdtree = None
+        
+    def _compute_layout(self) -> dict:
+        """Get node positions for the current graph and layout algorithm.
+        
+        Recently computed layouts are cached by algorithm and topology, so
+        switching back to a previous layout or view does not re-run the solver.
+        """
+        key = (
+            self.layout_algorithm,
+            frozenset(self.graph.nodes()),
+            frozenset(frozenset(edge) for edge in self.graph.edges()),
+        )
+        pos = self._layout_cache.get(key)
+        if pos is not None:
+            self._layout_cache.move_to_end(key)
+            return pos
+        
+        pos = self._run_layout_algorithm()
+        self._layout_cache[key] = pos
+        if len(self._layout_cache) > self.LAYOUT_CACHE_SIZE:
+            self._layout_cache.popitem(last=False)
+        return pos
+        
+    def _run_layout_algorithm(self) -> dict:
+        """Compute node positions using the selected layout algorithm."""
+        if self.layout_algorithm == 'spring':
+            # Warm-started from a seed, so fewer iterations reach the same quality
+            seed = self._spring_seed()
+            if (self.graph.number_of_nodes() >= self.COMPILED_LAYOUT_MIN_NODES
+                    and _fr_layout_module().HAS_NUMBA):
+                return self._compiled_spring_layout(seed, k=1.0, iterations=20)
+            return nx.spring_layout(self.graph, pos=seed, k=1, iterations=20)
+        elif self.layout_algorithm == 'circular':
+            return nx.circular_layout(self.graph)
+        elif self.layout_algorithm == 'kamada_kawai':
+            return nx.kamada_kawai_layout(self.graph)
+        elif self.layout_algorithm == 'shell':
+            return nx.shell_layout(self.graph)
+        else:
+            return nx.spring_layout(self.graph)
+        
+    def _spring_seed(self) -> dict:
+        """Get starting positions for the spring layout.
+        
+        Nodes keep the position they had in the last drawn layout, whichever
+        algorithm produced it; any others start on a circle.
+        """
+        seed = nx.circular_layout(self.graph)
+        if self._seed_pos:
+            seed.update((node_id, self._seed_pos[node_id])
+                        for node_id in self.graph if node_id in self._seed_pos)
+        return seed
+        
+    def _compiled_spring_layout(self, seed: dict, k: float, iterations: int) -> dict:
+        """Spring layout using the Numba-compiled Fruchterman-Reingold kernel."""
+        node_ids = list(self.graph.nodes())
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        edge_count = self.graph.number_of_edges()
+        edges_src = np.fromiter((index[u] for u, _ in self.graph.edges()), dtype=np.int64, count=edge_count)
+        edges_dst = np.fromiter((index[v] for _, v in self.graph.edges()), dtype=np.int64, count=edge_count)
+        
+        pos = np.array([seed[node_id] for node_id in node_ids], dtype=np.float64)
+        _fr_layout_module().fr_layout(pos, edges_src, edges_dst, iterations, k)
+        pos = nx.rescale_layout(pos)
+        return dict(zip(node_ids, pos))
+        
+    def _node_at(self, x, y):
+        """Get the ID of the node drawn at a data position, or None."""
+        if x is None or y is None or self.graph.number_of_nodes() == 0:
+            return None
+        
+        # Reuse the positions that were drawn; a fresh layout would not match
+        if self._pos_array is None:
+            self._set_positions(self._compute_layout())
+        
+        if self._kdtree is None:
+            kdtree_class = _kdtree_class()
+            if kdtree_class is not None:
+                self._kdtree = kdtree_class(self._pos_array)
+        
+        if self._kdtree is not None:
+            distance, closest = self._kdtree.query((x, y))
+        else:
+            # Squared distances to every node in one vectorized pass
+            offsets = self._pos_array - (x, y)
+            squared = (offsets * offsets).sum(axis=1)
+            closest = int(squared.argmin())
+            distance = squared[closest] ** 0.5
+        
+        # Threshold for hits (0.1 in normalized coordinates)
+        if distance < 0.1:
+            return self._node_ids[closest]
+        return None
         
     def _on_click(self, mpl_event):
         """Handle click on graph node."""
         if mpl_event.inaxes != self.axes:
             return
         
-        # Find closest node to click
-        click_x = mpl_event.xdata
-        click_y = mpl_event.ydata
-        
-        if click_x is None or click_y is None:
+        node_id = self._node_at(mpl_event.xdata, mpl_event.ydata)
+        if node_id is None:
             return
         
-        # Get node positions
-        if self.layout_algorithm == 'spring':
-            pos = nx.spring_layout(self.graph, k=1, iterations=50)
-        elif self.layout_algorithm == 'circular':
-            pos = nx.circular_layout(self.graph)
-        elif self.layout_algorithm == 'kamada_kawai':
-            pos = nx.kamada_kawai_layout(self.graph)
-        elif self.layout_algorithm == 'shell':
-            pos = nx.shell_layout(self.graph)
-        else:
-            pos = nx.spring_layout(self.graph)
-        
-        closest_node = None
-        min_distance = float('inf')
-        
-        for node_id, (x, y) in pos.items():
-            distance = ((x - click_x) ** 2 + (y - click_y) ** 2) ** 0.5
-            if distance < min_distance:
-                min_distance = distance
-                closest_node = node_id
-        
-        # Threshold for clicking (0.1 in normalized coordinates)
-        if closest_node and min_distance < 0.1:
-            node_data = self.graph.nodes[closest_node]
-            entity = node_data.get('entity')
-            if entity:
-                self.node_clicked.emit(entity)
+        entity = self.graph.nodes[node_id].get('entity')
+        if entity:
+            self.node_clicked.emit(entity)
+        elif node_id in self._community_map:
+            self.expand_community(node_id)
+        
+    def _on_draw(self, mpl_event):
+        """Cache the freshly drawn axes so hover highlights can be blitted."""
+        self._background = self.copy_from_bbox(self.axes.bbox)
+        self._hovered_node = None
+        
+    def _on_motion(self, mpl_event):
+        """Highlight the node under the mouse without redrawing the figure."""
+        node_id = None
+        if mpl_event.inaxes == self.axes and self._background is not None:
+            node_id = self._node_at(mpl_event.xdata, mpl_event.ydata)
+        if node_id == self._hovered_node:
+            return
+        self._hovered_node = node_id
+        
+        # Restore the cached pixels, then paint only the highlight on top
+        self.restore_region(self._background)
+        if node_id is not None:
+            if self._hover_artist is None:
+                self._hover_artist = self.axes.scatter([], [], s=500,
+                                                       facecolors='none',
+                                                       edgecolors='gold',
+                                                       linewidths=2.5,
+                                                       zorder=4,
+                                                       animated=True)
+            self._hover_artist.set_offsets(np.asarray(self._pos[node_id]).reshape(1, 2))
+            self._hover_artist.set_sizes([self.graph.nodes[node_id].get('size', 500) + 200])
+            self.axes.draw_artist(self._hover_artist)
+        self.blit(self.axes.bbox)
 
 
 class RelationshipGraphWidget(QWidget):
@@ -319,9 +589,17 @@ class RelationshipGraphWidget(QWidget):
         self.relationship_service = relationship_service
         self.figure_service = figure_service
         self.current_universe_id = None
+        self._last_signature = None  # Signature of the data last passed to the canvas
         
         self.init_ui()
         
+        # Coalesce rapid toolbar changes into one render; render_graph only
+        # re-runs the layout when a layout change invalidated the positions
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(50)
+        self._render_timer.timeout.connect(self.canvas.render_graph)
+        
     def init_ui(self):
         """Initialize the user interface."""
         layout = QVBoxLayout(self)
@@ -393,12 +671,33 @@ class RelationshipGraphWidget(QWidget):
             else:
                 figures = []
             
-            # Update canvas
-            self.canvas.set_data(figures, relationships)
+            # Skip the rebuild and layout entirely when nothing visible changed
+            signature = self._data_signature(figures, relationships)
+            if signature == self._last_signature:
+                return
+            
+            # Update canvas, keeping positions when refreshing the same universe
+            if self._last_signature is not None and self._last_signature[0] == self.current_universe_id:
+                self.canvas.update_data(figures, relationships)
+            else:
+                self.canvas.set_data(figures, relationships)
+            self._last_signature = signature
             
         except Exception as e:
             print(f"Error refreshing relationship graph: {e}")
             
+    def _data_signature(self, figures, relationships) -> tuple:
+        """Get a hashable summary of everything the graph displays."""
+        return (
+            self.current_universe_id,
+            frozenset((figure.id, figure.name, type(figure).__name__) for figure in figures),
+            frozenset(
+                (getattr(rel, 'from_figure_id', None), getattr(rel, 'to_figure_id', None),
+                 getattr(rel, 'type', None), getattr(rel, 'strength', None))
+                for rel in relationships
+            ),
+        )
+        
     def focus_on_entity(self, entity_id):
         """Focus graph on specific entity."""
         self.canvas.focus_on_entity(entity_id)
@@ -415,11 +714,13 @@ class RelationshipGraphWidget(QWidget):
             "Kamada-Kawai": "kamada_kawai",
             "Shell": "shell"
         }
-        self.canvas.set_layout(layout_map.get(layout_text, "spring"))
+        self.canvas.set_layout(layout_map.get(layout_text, "spring"), redraw=False)
+        self._render_timer.start()
         
     def _on_labels_changed(self, state):
         """Handle labels checkbox change."""
-        self.canvas.set_show_labels(state == Qt.CheckState.Checked.value)
+        self.canvas.set_show_labels(state == Qt.CheckState.Checked.value, redraw=False)
+        self._render_timer.start()
         
     def _on_node_clicked(self, entity):
         """Handle node click."""
@@ -9,71 +9,135 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
 from PyQt6.QtGui import (QTextCharFormat, QFont, QColor, QTextCursor, 
                          QTextListFormat, QAction, QIcon, QTextDocument,
                          QSyntaxHighlighter, QTextFormat)
-from PyQt6.QtCore import Qt, pyqtSignal, QRegularExpression
-import markdown
+from PyQt6.QtCore import Qt, pyqtSignal
 import re
+import string
+
+
+# Common English words plus worldbuilding terms (expandable)
+_BASIC_DICTIONARY = frozenset({
+    'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
+    'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
+    'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
+    'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their', 'what',
+    'so', 'up', 'out', 'if', 'about', 'who', 'get', 'which', 'go', 'me',
+    'when', 'make', 'can', 'like', 'time', 'no', 'just', 'him', 'know', 'take',
+    'people', 'into', 'year', 'your', 'good', 'some', 'could', 'them', 'see', 'other',
+    'than', 'then', 'now', 'look', 'only', 'come', 'its', 'over', 'think', 'also',
+    'back', 'after', 'use', 'two', 'how', 'our', 'work', 'first', 'well', 'way',
+    'even', 'new', 'want', 'because', 'any', 'these', 'give', 'day', 'most', 'us',
+    'is', 'was', 'are', 'been', 'has', 'had', 'were', 'said', 'did', 'having',
+    'may', 'should', 'am', 'being', 'does', 'done', 'world', 'character', 'story',
+    'location', 'species', 'figure', 'event', 'timeline', 'universe', 'relationship'
+})
+
+
+# Characters that make up a word for spell checking, and the word characters
+# that are not letters; runs touching those (e.g. "abc123") are not words
+_WORD_CHARS = frozenset(string.ascii_letters + "'")
+_NON_LETTER_WORD_CHARS = frozenset(string.digits + '_')
+
+# Underline color for misspelled words
+_MISSPELL_COLOR = QColor(Qt.GlobalColor.red)
 
 
 class SpellCheckHighlighter(QSyntaxHighlighter):
     """Basic spell checker using simple word list"""
     
+    CLEAN_BLOCK_CACHE_SIZE = 1024
+    
     def __init__(self, document):
         super().__init__(document)
         self.spell_check_enabled = False
-        # Basic English word pattern (words with letters and apostrophes)
-        self.word_pattern = QRegularExpression(r"\b[A-Za-z']+\b")
-        
-        # Simple common words dictionary (expandable)
-        self.known_words = self._load_basic_dictionary()
-        
-    def _load_basic_dictionary(self):
-        """Load a basic dictionary of common words"""
-        # This is a minimal set - in production, load from a file
-        common_words = {
-            'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
-            'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
-            'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
-            'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their', 'what',
-            'so', 'up', 'out', 'if', 'about', 'who', 'get', 'which', 'go', 'me',
-            'when', 'make', 'can', 'like', 'time', 'no', 'just', 'him', 'know', 'take',
-            'people', 'into', 'year', 'your', 'good', 'some', 'could', 'them', 'see', 'other',
-            'than', 'then', 'now', 'look', 'only', 'come', 'its', 'over', 'think', 'also',
-            'back', 'after', 'use', 'two', 'how', 'our', 'work', 'first', 'well', 'way',
-            'even', 'new', 'want', 'because', 'any', 'these', 'give', 'day', 'most', 'us',
-            'is', 'was', 'are', 'been', 'has', 'had', 'were', 'said', 'did', 'having',
-            'may', 'should', 'am', 'being', 'does', 'done', 'world', 'character', 'story',
-            'location', 'species', 'figure', 'event', 'timeline', 'universe', 'relationship'
-        }
-        return common_words
+        
+        # Stay detached while disabled so Qt doesn't call highlightBlock on edits
+        self._doc = document
+        self.setDocument(None)
+        
+        # Format for misspelled words (red underline), shared by every block
+        self._misspelled_format = QTextCharFormat()
+        self._misspelled_format.setUnderlineColor(_MISSPELL_COLOR)
+        self._misspelled_format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SpellCheckUnderline)
+        
+        # Simple common words dictionary, shared by all highlighters
+        self.known_words = _BASIC_DICTIONARY
+        
+        # Block texts already found to have no misspellings; most paragraphs
+        # are clean, so rehighlighting them skips the scan entirely
+        self._clean_blocks = set()
         
     def set_enabled(self, enabled):
         """Enable or disable spell checking"""
         self.spell_check_enabled = enabled
-        self.rehighlight()
+        if enabled:
+            # Attaching schedules one full rehighlight for the next event loop pass
+            self.setDocument(self._doc)
+        else:
+            # Detaching also clears the existing underlines
+            self.setDocument(None)
         
     def highlightBlock(self, text):
         """Highlight misspelled words"""
-        if not self.spell_check_enabled:
+        if not self.spell_check_enabled or text in self._clean_blocks:
             return
             
-        # Format for misspelled words (red underline)
-        misspelled_format = QTextCharFormat()
-        misspelled_format.setUnderlineColor(QColor(Qt.GlobalColor.red))
-        misspelled_format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SpellCheckUnderline)
-        
-        # Find all words
-        iterator = self.word_pattern.globalMatch(text)
-        while iterator.hasNext():
-            match = iterator.next()
-            word = match.captured(0).lower()
+        # Qt positions count UTF-16 code units, which only differ from str
+        # indices when the block holds characters outside the BMP
+        wide = not text.isascii() and max(text) > '\uffff'
+        
+        # Misspelled words separated only by whitespace (e.g. invented names
+        # and phrases) are underlined as one span to cut setFormat calls
+        spans = []
+        
+        # Scan runs of letters and apostrophes in a single pass
+        i, n = 0, len(text)
+        while i < n:
+            if text[i] not in _WORD_CHARS:
+                i += 1
+                continue
+            j = i + 1
+            while j < n and text[j] in _WORD_CHARS:
+                j += 1
+            start, end = i, j
+            i = j
             
-            # Check if word is unknown (simple check - not in dictionary)
-            if len(word) > 2 and word not in self.known_words:
-                # Check if it's a proper noun (starts with capital)
-                if not match.captured(0)[0].isupper():
-                    self.setFormat(match.capturedStart(0), 
-                                 match.capturedLength(0), 
-                                 misspelled_format)
+            if (start > 0 and text[start - 1] in _NON_LETTER_WORD_CHARS) or \
+               (end < n and text[end] in _NON_LETTER_WORD_CHARS):
+                continue
+            
+            # Apostrophes only count inside a word, not as quotes around it
+            while start < end and text[start] == "'":
+                start += 1
+            while end > start and text[end - 1] == "'":
+                end -= 1
+            
+            # One- and two-letter tokens are almost always function words, and
+            # proper nouns (starting with a capital) are never flagged
+            length = end - start
+            if length <= 2 or text[start].isupper():
+                continue
+            
+            # Check if word is unknown (simple check - not in dictionary);
+            # the dictionary is a frozenset, so this is a single hash lookup
+            if text[start:end].lower() not in self.known_words:
+                if spans and text[spans[-1][1]:start].isspace():
+                    spans[-1][1] = end
+                else:
+                    spans.append([start, end])
+        
+        if not spans:
+            if len(self._clean_blocks) >= self.CLEAN_BLOCK_CACHE_SIZE:
+                self._clean_blocks.clear()
+            self._clean_blocks.add(text)
+            return
+        
+        for start, end in spans:
+            if wide:
+                length = len(text[start:end].encode('utf-16-le')) // 2
+                start = len(text[:start].encode('utf-16-le')) // 2
+            else:
+                length = end - start
+            self.setFormat(start, length, self._misspelled_format)
 
 
 class RichTextEditor(QWidget):
@@ -86,10 +150,27 @@ class RichTextEditor(QWidget):
         self.enable_markdown = enable_markdown
         self.enable_spell_check_option = enable_spell_check
         self.spell_checker = None
+        self._last_html = None  # Rich text shown before entering markdown mode
+        self._md_revision = -1  # Document revision right after entering markdown mode
         self.setup_ui()
         
     def setup_ui(self):
         """Set up the editor UI"""
+        # Formats applied by the toolbar, built once rather than on every click
+        self._bold_on = QTextCharFormat()
+        self._bold_on.setFontWeight(QFont.Weight.Bold)
+        self._bold_off = QTextCharFormat()
+        self._bold_off.setFontWeight(QFont.Weight.Normal)
+        self._italic_on = QTextCharFormat()
+        self._italic_on.setFontItalic(True)
+        self._italic_off = QTextCharFormat()
+        self._italic_off.setFontItalic(False)
+        self._underline_on = QTextCharFormat()
+        self._underline_on.setFontUnderline(True)
+        self._underline_off = QTextCharFormat()
+        self._underline_off.setFontUnderline(False)
+        self._tmp_fmt = QTextCharFormat()  # Reused for family, size and color; left empty
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
@@ -100,8 +181,9 @@ class RichTextEditor(QWidget):
         # Create text editor
         self.text_edit = QTextEdit()
         self.text_edit.setAcceptRichText(True)
-        self.text_edit.textChanged.connect(self.textChanged.emit)
+        self.text_edit.textChanged.connect(self.textChanged)
         self.text_edit.cursorPositionChanged.connect(self.update_format_buttons)
+        self._cursor_sig_connected = True
         layout.addWidget(self.text_edit)
         
         # Set up spell checker if enabled
@@ -226,53 +308,56 @@ class RichTextEditor(QWidget):
     def update_format_buttons(self):
         """Update toolbar buttons based on current cursor position"""
         fmt = self.text_edit.currentCharFormat()
+        font = fmt.font()
         
         self.bold_btn.setChecked(fmt.fontWeight() == QFont.Weight.Bold)
         self.italic_btn.setChecked(fmt.fontItalic())
         self.underline_btn.setChecked(fmt.fontUnderline())
         
-        # Update font combo and size
-        self.font_combo.setCurrentFont(fmt.font())
-        if fmt.font().pointSize() > 0:
-            self.font_size_spin.setValue(int(fmt.font().pointSize()))
+        # Update font combo and size without re-applying them to the text
+        self.font_combo.blockSignals(True)
+        self.font_combo.setCurrentFont(font)
+        self.font_combo.blockSignals(False)
+        point_size = font.pointSize()
+        if point_size > 0:
+            self.font_size_spin.blockSignals(True)
+            self.font_size_spin.setValue(int(point_size))
+            self.font_size_spin.blockSignals(False)
             
     def toggle_bold(self):
         """Toggle bold formatting"""
-        fmt = QTextCharFormat()
-        fmt.setFontWeight(QFont.Weight.Bold if self.bold_btn.isChecked() else QFont.Weight.Normal)
-        self.merge_format(fmt)
+        self.merge_format(self._bold_on if self.bold_btn.isChecked() else self._bold_off)
         
     def toggle_italic(self):
         """Toggle italic formatting"""
-        fmt = QTextCharFormat()
-        fmt.setFontItalic(self.italic_btn.isChecked())
-        self.merge_format(fmt)
+        self.merge_format(self._italic_on if self.italic_btn.isChecked() else self._italic_off)
         
     def toggle_underline(self):
         """Toggle underline formatting"""
-        fmt = QTextCharFormat()
-        fmt.setFontUnderline(self.underline_btn.isChecked())
-        self.merge_format(fmt)
+        self.merge_format(self._underline_on if self.underline_btn.isChecked() else self._underline_off)
         
     def change_font_family(self, font):
         """Change font family"""
-        fmt = QTextCharFormat()
+        fmt = self._tmp_fmt
         fmt.setFontFamily(font.family())
         self.merge_format(fmt)
+        fmt.clearProperty(QTextFormat.Property.FontFamilies)
         
     def change_font_size(self, size):
         """Change font size"""
-        fmt = QTextCharFormat()
+        fmt = self._tmp_fmt
         fmt.setFontPointSize(size)
         self.merge_format(fmt)
+        fmt.clearProperty(QTextFormat.Property.FontPointSize)
         
     def change_text_color(self):
         """Change text color"""
         color = QColorDialog.getColor(Qt.GlobalColor.black, self, "Select Text Color")
         if color.isValid():
-            fmt = QTextCharFormat()
+            fmt = self._tmp_fmt
             fmt.setForeground(color)
             self.merge_format(fmt)
+            fmt.clearForeground()
             
     def insert_bullet_list(self):
         """Insert a bullet list"""
@@ -305,33 +390,63 @@ class RichTextEditor(QWidget):
     def merge_format(self, fmt):
         """Merge character format with current selection"""
         cursor = self.text_edit.textCursor()
-        if not cursor.hasSelection():
-            cursor.select(QTextCursor.SelectionType.WordUnderCursor)
+        if cursor.hasSelection():
+            cursor.mergeCharFormat(fmt)
+            return
+        
+        # Without a selection, format the word under the cursor and the
+        # text typed next
+        cursor.select(QTextCursor.SelectionType.WordUnderCursor)
         cursor.mergeCharFormat(fmt)
         self.text_edit.mergeCurrentCharFormat(fmt)
         
     def toggle_markdown_mode(self, enabled):
         """Toggle between rich text and markdown mode"""
+        # Swap the content in a single edit block, with textChanged held back
+        # until the new content is in place; an attached spell checker
+        # highlights the new content as it goes in, which also makes the
+        # document report a change
+        unedited = not enabled and self.text_edit.document().revision() == self._md_revision
+        self.text_edit.textChanged.disconnect(self.textChanged)
+        cursor = self.text_edit.textCursor()
+        cursor.beginEditBlock()
+        try:
+            self._swap_markdown_content(enabled, unedited)
+        finally:
+            cursor.endEditBlock()
+            self.text_edit.textChanged.connect(self.textChanged)
+        
+        if enabled:
+            self._md_revision = self.text_edit.document().revision()
+        self.textChanged.emit()
+        
+    def _swap_markdown_content(self, enabled, unedited):
+        """Replace the editor content for entering or leaving markdown mode
+        
+        Args:
+            enabled: True when entering markdown mode
+            unedited: True when leaving markdown mode with no edits made in it
+        """
         if enabled:
-            # Convert to plain markdown
-            html = self.text_edit.toHtml()
-            # Basic HTML to Markdown conversion (simplified)
-            text = self.text_edit.toPlainText()
+            # Convert to markdown, keeping the formatting as markup
+            self._last_html = self.text_edit.toHtml()
+            text = self.get_markdown().rstrip("\n")
             self.text_edit.setAcceptRichText(False)
             self.text_edit.setPlainText(text)
             self.toolbar.setEnabled(False)
+        elif unedited:
+            # Nothing was edited in markdown mode, so restore the rich text
+            # as it was instead of copying the buffer out and re-parsing it
+            self.text_edit.setAcceptRichText(True)
+            self.text_edit.setHtml(self._last_html)
+            self.toolbar.setEnabled(True)
         else:
-            # Convert markdown to HTML
+            # Let Qt parse the markdown straight into the document
             markdown_text = self.text_edit.toPlainText()
-            try:
-                html = markdown.markdown(markdown_text, extensions=['extra', 'nl2br'])
-                self.text_edit.setAcceptRichText(True)
-                self.text_edit.setHtml(html)
-                self.toolbar.setEnabled(True)
-            except Exception as e:
-                print(f"Markdown parsing error: {e}")
-                self.text_edit.setAcceptRichText(True)
-                self.toolbar.setEnabled(True)
+            self.text_edit.setAcceptRichText(True)
+            self.text_edit.document().setMarkdown(
+                markdown_text, QTextDocument.MarkdownFeature.MarkdownDialectGitHub)
+            self.toolbar.setEnabled(True)
                 
     def get_html(self):
         """Get content as HTML"""
@@ -341,6 +456,11 @@ class RichTextEditor(QWidget):
         """Get content as plain text"""
         return self.text_edit.toPlainText()
         
+    def get_markdown(self):
+        """Get content as GitHub-flavored markdown"""
+        return self.text_edit.document().toMarkdown(
+            QTextDocument.MarkdownFeature.MarkdownDialectGitHub)
+        
     def set_html(self, html):
         """Set content from HTML"""
         self.text_edit.setHtml(html)
@@ -358,6 +478,15 @@ class RichTextEditor(QWidget):
         self.text_edit.setReadOnly(read_only)
         self.toolbar.setEnabled(not read_only)
         
+        # The toolbar only tracks the cursor while it can be used
+        if read_only and self._cursor_sig_connected:
+            self.text_edit.cursorPositionChanged.disconnect(self.update_format_buttons)
+            self._cursor_sig_connected = False
+        elif not read_only and not self._cursor_sig_connected:
+            self.text_edit.cursorPositionChanged.connect(self.update_format_buttons)
+            self._cursor_sig_connected = True
+            self.update_format_buttons()
+        
     def toggle_spell_check(self, enabled):
         """Toggle spell checking"""
         if self.spell_checker:
@@ -4,21 +4,89 @@ Displays events on an interactive timeline with zoom, pan, and multiple view mod
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QComboBox, 
-    QSlider, QLabel, QScrollArea, QToolBar, QSplitter, QListWidget,
-    QListWidgetItem
+    QWidget, QVBoxLayout, QPushButton, QComboBox, 
+    QSlider, QLabel, QToolBar, QSplitter, QListView, QProgressBar
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QPointF, QSize
-from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QPainterPath
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict
-import sys
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QAbstractListModel, QModelIndex,
+    QObject, QRunnable, QThreadPool
+)
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+
+from worldbuilder.database.event_repository import EventRepository, TimelineRepository
+from worldbuilder.services.event_service import EventService, TimelineService
 
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-from matplotlib.patches import Rectangle
+from matplotlib.collections import PolyCollection
+
+
+# Color mapping for event types
+_TYPE_COLORS = {
+    'birth': 'green',
+    'death': 'black',
+    'battle': 'red',
+    'meeting': 'blue',
+    'discovery': 'purple',
+    'creation': 'orange',
+    'political': 'darkblue',
+    'cultural': 'pink',
+    'natural': 'brown',
+}
+
+# Qt enum members resolved once; data() runs for every painted row
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_UR = Qt.ItemDataRole.UserRole
+
+
+class EventListModel(QAbstractListModel):
+    """Read-only list model of events, labelled with their dates.
+    
+    Labels are formatted only for the rows the view paints, and the event on
+    each row is exposed through ``Qt.ItemDataRole.UserRole``.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._events: List = []
+    
+    def set_events(self, events: List):
+        """Replace the listed events.
+        
+        Args:
+            events: Events to list, one per row
+        """
+        self.beginResetModel()
+        self._events = list(events)
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._events)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        event = self._events[index.row()]
+        if role == _DISPLAY_ROLE:
+            date_str = ""
+            if hasattr(event, 'exact_date') and event.exact_date:
+                # Same text as strftime('%Y-%m-%d'), without the libc call
+                date = event.exact_date
+                date_str = f"{date.year}-{date.month:02d}-{date.day:02d}"
+            elif hasattr(event, 'year') and event.year:
+                date_str = str(event.year)
+            return f"{date_str} - {event.name}"
+        if role == _UR:
+            return event
+        return None
 
 
 class TimelineCanvas(FigureCanvas):
@@ -27,6 +95,15 @@ class TimelineCanvas(FigureCanvas):
     """
     event_clicked = pyqtSignal(object)  # Emits Event object
     
+    LABEL_LIMIT = 200  # Most labels drawn per lane; denser lanes are decimated
+    
+    # Render method for each view mode
+    _RENDERERS = {
+        "linear": "_render_linear",
+        "swimlane": "_render_swimlane",
+        "calendar": "_render_calendar",
+    }
+    
     def __init__(self, parent=None, width=12, height=6, dpi=100):
         self.fig = Figure(figsize=(width, height), dpi=dpi)
         self.axes = self.fig.add_subplot(111)
@@ -35,211 +112,457 @@ class TimelineCanvas(FigureCanvas):
         
         self.events = []
         self.timelines = []
+        self._event_timeline_index = {}  # id(event) -> frozenset of timeline IDs
+        
+        # Per-event arrays aligned with self.events, built once in set_events
+        self._dates = np.array([], dtype='datetime64[s]')  # NaT when undated
+        self._sorted_idx = np.array([], dtype=np.intp)  # Event indices by date
+        self._sorted_dates = np.array([], dtype='datetime64[s]')  # Dated events only
+        self._names = np.array([], dtype=object)
+        self._type_codes = np.array([], dtype=np.intp)  # Index into _color_lut
+        self._color_lut = np.array([], dtype=object)  # Color per distinct type
+        self._colors = np.array([], dtype=object)
+        self._calendar_cache = None  # (timeline filter, month dates, counts)
         self.selected_timeline_ids = []
         self.view_mode = "linear"  # linear, swimlane, calendar
         self.zoom_level = 1.0
         self.current_marker_date = None
-        
-        # Connect click event
+        self._marker_line = None  # Animated 'now' line, blitted when moved
+        self._scatter = None  # Event markers, updated in place between renders
+        self._text_artists = []  # Event labels, reused between renders
+        self._calendar_bars = None
+        self._rendered_mode = None  # View mode the axes artists were built for
+        self._render_view = self._render_linear  # Picked by _select_renderer
+        self._background = None  # Axes pixels from the last full draw, for blitting
+        
+        # Concise date labels stay short enough to need no rotation, so the
+        # figure never has to be re-laid out with autofmt_xdate
+        self._date_locator = mdates.AutoDateLocator()
+        self._date_formatter = mdates.ConciseDateFormatter(self._date_locator)
+        
+        # Setters schedule a render; bursts (e.g. dragging the zoom slider)
+        # coalesce into a single redraw once they pause
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(30)
+        self._render_timer.timeout.connect(self._do_render)
+        
+        # Connect click and draw events
         self.mpl_connect('button_press_event', self._on_click)
+        self.mpl_connect('draw_event', self._on_draw)
         
     def set_events(self, events: List, timelines: List = None):
         """Set events and optional timelines to display."""
         self.events = events or []
         self.timelines = timelines or []
+        self._event_timeline_index = {
+            id(event): frozenset(t.id for t in getattr(event, 'timelines', []))
+            for event in self.events
+        }
+        
+        self._dates = np.array(
+            [self._get_event_date(event) or 'NaT' for event in self.events],
+            dtype='datetime64[s]')
+        self._sorted_idx = np.argsort(self._dates, kind='stable')  # NaT sorts last
+        sorted_dates = self._dates[self._sorted_idx]
+        self._sorted_dates = sorted_dates[~np.isnat(sorted_dates)]
+        self._names = np.array([event.name[:30] for event in self.events], dtype=object)
+        
+        # Colors are looked up once per distinct type, then gathered by code
+        types = np.array([getattr(event, 'type', '').lower() for event in self.events],
+                         dtype=object)
+        type_names, self._type_codes = np.unique(types, return_inverse=True)
+        self._color_lut = np.array([self._type_color(t) for t in type_names], dtype=object)
+        self._colors = self._color_lut[self._type_codes]
+        self._calendar_cache = None
+        self._rendered_mode = None  # Lanes and labels depend on the timelines
+        self._select_renderer()
         self.render_timeline()
         
+    def sorted_events(self) -> List:
+        """Get the events in date order, undated events last."""
+        return [self.events[i] for i in self._sorted_idx]
+        
     def set_timeline_filter(self, timeline_ids: List):
         """Filter events by timeline IDs."""
+        if list(timeline_ids) == list(self.selected_timeline_ids):
+            return
         self.selected_timeline_ids = timeline_ids
         self.render_timeline()
         
     def set_view_mode(self, mode: str):
         """Set timeline view mode: linear, swimlane, or calendar."""
+        if mode == self.view_mode:
+            return
         self.view_mode = mode
+        self._select_renderer()
         self.render_timeline()
         
+    def _select_renderer(self):
+        """Pick the render method for the view mode once, not on every render.
+        
+        Swimlanes need timelines to lay out, so without any the swimlane
+        view renders as the linear view.
+        """
+        mode = self.view_mode
+        if mode == "swimlane" and not self.timelines:
+            mode = "linear"
+        name = self._RENDERERS.get(mode)
+        self._render_view = getattr(self, name) if name else None
+        
     def set_zoom(self, level: float):
         """Set zoom level (0.1 to 10.0)."""
-        self.zoom_level = max(0.1, min(10.0, level))
+        level = max(0.1, min(10.0, level))
+        if level == self.zoom_level:
+            return
+        self.zoom_level = level
         self.render_timeline()
         
     def set_current_marker(self, date: Optional[datetime]):
         """Set the 'now' marker position."""
+        if date == self.current_marker_date:
+            return
         self.current_marker_date = date
+        
+        # Moving an existing marker within the visible range only repaints the
+        # line over the cached background; anything else needs a full render
+        if (date and self._marker_line is not None and self._background is not None
+                and not self._render_timer.isActive()):
+            x = mdates.date2num(date)
+            low, high = sorted(self.axes.get_xlim())
+            if low <= x <= high:
+                self._marker_line.set_xdata([x, x])
+                self.restore_region(self._background)
+                self.axes.draw_artist(self._marker_line)
+                self.blit(self.axes.bbox)
+                return
+        
         self.render_timeline()
         
     def render_timeline(self):
+        """Schedule a render of the timeline with the current settings."""
+        self._render_timer.start()
+        
+    def _do_render(self):
         """Render the timeline based on current settings."""
-        self.axes.clear()
+        self._render_timer.stop()
         
         if not self.events:
+            self._reset_axes()
             self.axes.text(0.5, 0.5, 'No events to display', 
                           ha='center', va='center', transform=self.axes.transAxes)
             self.draw()
             return
         
         # Filter events by selected timelines if filter is active
-        display_events = self._filter_events()
+        display_mask = self._filter_mask()
         
-        if not display_events:
+        if not display_mask.any():
+            self._reset_axes()
             self.axes.text(0.5, 0.5, 'No events match filter', 
                           ha='center', va='center', transform=self.axes.transAxes)
             self.draw()
             return
         
-        if self.view_mode == "linear":
-            self._render_linear(display_events)
-        elif self.view_mode == "swimlane":
-            self._render_swimlane(display_events)
-        elif self.view_mode == "calendar":
-            self._render_calendar(display_events)
+        # Artists are kept and updated in place while the view mode stays
+        # the same; the axes are only cleared when switching modes
+        if self.view_mode != self._rendered_mode:
+            self._reset_axes()
+            self._rendered_mode = self.view_mode
+        
+        if self._render_view is not None:
+            self._render_view(display_mask)
         
         self.draw()
         
+    def _reset_axes(self):
+        """Clear the axes and forget the artists that were drawn on them."""
+        self.axes.clear()
+        self._scatter = None
+        self._text_artists = []
+        self._calendar_bars = None
+        self._marker_line = None
+        self._rendered_mode = None
+        
+        # Clearing the axes resets its ticker, so put the shared date
+        # locator and formatter back rather than building new ones
+        self.axes.xaxis.set_major_locator(self._date_locator)
+        self.axes.xaxis.set_major_formatter(self._date_formatter)
+        
     def _filter_events(self):
         """Filter events based on selected timelines."""
         if not self.selected_timeline_ids:
             return self.events
+        return [self.events[i] for i in np.flatnonzero(self._filter_mask())]
         
-        filtered = []
-        for event in self.events:
-            # Check if event is in any of the selected timelines
-            event_timeline_ids = [t.id for t in getattr(event, 'timelines', [])]
-            if any(tid in self.selected_timeline_ids for tid in event_timeline_ids):
-                filtered.append(event)
-        return filtered
-        
-    def _render_linear(self, events: List):
+    def _filter_mask(self) -> np.ndarray:
+        """Get a boolean mask over self.events of the events to display."""
+        if not self.selected_timeline_ids:
+            return np.ones(len(self.events), dtype=bool)
+        
+        # Keep events that belong to any of the selected timelines
+        selected = frozenset(self.selected_timeline_ids)
+        index = self._event_timeline_index
+        return np.fromiter(
+            (not index[id(event)].isdisjoint(selected) for event in self.events),
+            dtype=bool, count=len(self.events))
+        
+    def _sorted_dated(self, mask: np.ndarray) -> np.ndarray:
+        """Get indices of the masked events that have a date, in date order."""
+        order = self._sorted_idx
+        keep = mask[order] & ~np.isnat(self._dates[order])
+        return order[keep]
+        
+    def _render_linear(self, mask: np.ndarray):
         """Render linear timeline view."""
-        # Sort events by date
-        sorted_events = sorted(events, key=lambda e: self._get_event_date(e))
-        
-        dates = []
-        names = []
-        colors = []
-        
-        for event in sorted_events:
-            date = self._get_event_date(event)
-            if date:
-                dates.append(date)
-                names.append(event.name[:30])  # Truncate long names
-                colors.append(self._get_event_color(event))
-        
-        if not dates:
-            return
-        
-        # Plot events
-        y_positions = list(range(len(dates)))
-        self.axes.scatter(dates, y_positions, s=100, c=colors, alpha=0.7, edgecolors='black')
-        
-        # Add event labels
-        for i, (date, name) in enumerate(zip(dates, names)):
-            self.axes.text(date, i, f'  {name}', va='center', fontsize=8)
+        # Dates, names and colors were extracted and sorted in set_events
+        order = self._sorted_dated(mask)
+        
+        # Rows follow the overall date order, so zooming doesn't move events
+        # between rows; only events inside the zoomed window are drawn
+        y_positions = np.arange(len(order))
+        window = self._visible_window(order)
+        if window is not None:
+            visible = self._in_window(order, window)
+            order = order[visible]
+            y_positions = y_positions[visible]
+        
+        xs = mdates.date2num(self._dates[order])
+        names = self._names[order]  # Truncated to 30 characters
+        
+        if self._scatter is None:
+            self.axes.set_ylabel('Events')
+            self.axes.set_title('Timeline - Linear View')
+            self.axes.grid(True, alpha=0.3)
+        
+        # Plot events and label them
+        self._update_scatter(xs, y_positions, self._colors[order])
+        labelled = self._label_indices(xs)
+        self._update_labels(xs[labelled], y_positions[labelled],
+                            [f'  {name}' for name in names[labelled]], fontsize=8)
         
         # Add current marker if set
-        if self.current_marker_date:
-            self.axes.axvline(self.current_marker_date, color='red', linestyle='--', 
-                            linewidth=2, label='Current Point')
-        
-        # Format x-axis
-        self.axes.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        self.fig.autofmt_xdate()
+        self._update_marker_line()
+        self._update_limits(window)
         
-        self.axes.set_ylabel('Events')
-        self.axes.set_title('Timeline - Linear View')
-        self.axes.grid(True, alpha=0.3)
-        
-        if self.current_marker_date:
-            self.axes.legend()
-        
-    def _render_swimlane(self, events: List):
+    def _render_swimlane(self, mask: np.ndarray):
         """Render swimlane timeline view with separate lanes per timeline."""
-        if not self.timelines:
-            self._render_linear(events)
-            return
+        # Only events inside the zoomed window are drawn
+        order = self._sorted_dated(mask)
+        window = self._visible_window(order)
+        if window is not None:
+            order = order[self._in_window(order, window)]
         
-        # Group events by timeline
+        # Group event indices by timeline, in date order
         timeline_events = {}
         for timeline in self.timelines:
             timeline_events[timeline.id] = []
         
-        for event in events:
-            event_timelines = getattr(event, 'timelines', [])
-            for timeline in event_timelines:
-                if timeline.id in timeline_events:
-                    timeline_events[timeline.id].append(event)
+        for i in order:
+            for timeline_id in self._event_timeline_index[id(self.events[i])]:
+                if timeline_id in timeline_events:
+                    timeline_events[timeline_id].append(i)
         
-        # Plot each timeline as a lane
+        # Plot each timeline as a lane; the markers of every lane are
+        # gathered into a single scatter instead of one artist per event
         lane_height = 1.0
-        timeline_names = []
+        indices = []
+        y_positions = []
         
         for i, timeline in enumerate(self.timelines):
-            y_base = i * lane_height
-            timeline_names.append(timeline.name[:20])
+            lane = timeline_events.get(timeline.id, [])
+            indices.extend(lane)
+            y_positions.extend([i * lane_height] * len(lane))
+        
+        if self._scatter is None:
+            # Lanes only change with the timelines, which resets the axes.
+            # Every other lane gets a background band spanning the full
+            # width, all drawn as one collection
+            bands = [[(0, y_base - 0.4), (1, y_base - 0.4), (1, y_base + 0.4), (0, y_base + 0.4)]
+                     for y_base in np.arange(0, len(self.timelines), 2) * lane_height]
+            self.axes.add_collection(PolyCollection(
+                bands, facecolors='lightgray', alpha=0.2,
+                transform=self.axes.get_yaxis_transform()), autolim=False)
             
-            # Draw lane background
-            if i % 2 == 0:
-                self.axes.axhspan(y_base - 0.4, y_base + 0.4, 
-                                 facecolor='lightgray', alpha=0.2)
+            # Format axes
+            self.axes.set_yticks([i * lane_height for i in range(len(self.timelines))])
+            self.axes.set_yticklabels([timeline.name[:20] for timeline in self.timelines])
             
-            # Plot events in this lane
-            lane_events = timeline_events.get(timeline.id, [])
-            for event in lane_events:
-                date = self._get_event_date(event)
-                if date:
-                    color = self._get_event_color(event)
-                    self.axes.scatter(date, y_base, s=100, c=color, 
-                                    alpha=0.7, edgecolors='black')
-                    self.axes.text(date, y_base, f'  {event.name[:15]}', 
-                                 va='center', fontsize=7)
-        
-        # Add current marker
+            self.axes.set_title('Timeline - Swimlane View')
+            self.axes.grid(True, alpha=0.3, axis='x')
+        
+        indices = np.array(indices, dtype=np.intp)
+        y_positions = np.array(y_positions, dtype=float)
+        xs = mdates.date2num(self._dates[indices])
+        self._update_scatter(xs, y_positions, self._colors[indices])
+        labelled = self._label_indices(xs, y_positions)
+        self._update_labels(xs[labelled], y_positions[labelled],
+                            [f'  {name[:15]}' for name in self._names[indices[labelled]]],
+                            fontsize=7)
+        
+        # Add current marker; every lane stays in view whatever is filtered
+        self._update_marker_line()
+        self._update_limits(window)
+        self.axes.set_ylim(-0.5, (len(self.timelines) - 0.5) * lane_height)
+        
+    def _visible_window(self, order: np.ndarray) -> Optional[tuple]:
+        """Get the x-range shown at the current zoom level.
+        
+        Zooming in narrows the window to 1/zoom of the events' date span,
+        centred on the current marker (or the middle of the span).
+        
+        Args:
+            order: Indices of the displayed, dated events in date order
+        
+        Returns:
+            (low, high) in matplotlib date numbers, or None when every event
+            is in view and the axes should autoscale
+        """
+        if self.zoom_level <= 1.0 or not len(order):
+            return None
+        
+        low, high = mdates.date2num(self._dates[order[[0, -1]]])
+        span = max(high - low, 1.0) / self.zoom_level
         if self.current_marker_date:
-            self.axes.axvline(self.current_marker_date, color='red', 
-                            linestyle='--', linewidth=2, label='Current Point')
+            center = mdates.date2num(self.current_marker_date)
+        else:
+            center = (low + high) / 2
+        return center - span / 2, center + span / 2
+        
+    def _in_window(self, order: np.ndarray, window: tuple) -> np.ndarray:
+        """Get a boolean mask of the events in order that fall inside window."""
+        xs = mdates.date2num(self._dates[order])
+        return (xs >= window[0]) & (xs <= window[1])
+        
+    def _label_indices(self, xs: np.ndarray, lanes: Optional[np.ndarray] = None) -> np.ndarray:
+        """Pick which events get a text label.
+        
+        Text layout dominates render time, so when there are LABEL_LIMIT or
+        more events the x-range is split into LABEL_LIMIT columns and only
+        the first event in each column (per lane) is labelled.
+        
+        Args:
+            xs: Date numbers of the drawn events
+            lanes: Optional lane of each event, e.g. its swimlane y position
+        
+        Returns:
+            Indices into xs of the events to label
+        """
+        count = len(xs)
+        if count < self.LABEL_LIMIT:
+            return np.arange(count)
+        
+        span = max(xs.max() - xs.min(), 1e-9)
+        columns = np.minimum(((xs - xs.min()) / span * self.LABEL_LIMIT).astype(np.int64),
+                             self.LABEL_LIMIT - 1)
+        if lanes is not None:
+            _, lane_codes = np.unique(lanes, return_inverse=True)
+            columns = columns + lane_codes * self.LABEL_LIMIT
+        _, first = np.unique(columns, return_index=True)
+        return np.sort(first)
+        
+    def _update_scatter(self, xs: np.ndarray, ys: np.ndarray, colors: np.ndarray):
+        """Show the event markers, reusing the scatter from the last render.
+        
+        Args:
+            xs: Date number of each event
+            ys: Row or lane of each event
+            colors: Face color of each event
+        """
+        if self._scatter is None:
+            self._scatter = self.axes.scatter([], [], s=100, alpha=0.7, edgecolors='black')
+        self._scatter.set_offsets(np.column_stack((xs, ys)))
+        self._scatter.set_facecolor(list(colors))
+        
+    def _update_labels(self, xs: np.ndarray, ys: np.ndarray, labels: List[str], fontsize: int):
+        """Show event labels, reusing the text artists from the last render.
+        
+        Args:
+            xs: Date number of each label
+            ys: Row or lane of each label
+            labels: Label texts
+            fontsize: Font size for newly created labels
+        """
+        pool = self._text_artists
+        for text, x, y, label in zip(pool, xs, ys, labels):
+            text.set_position((x, y))
+            text.set_text(label)
+        for x, y, label in zip(xs[len(pool):], ys[len(pool):], labels[len(pool):]):
+            pool.append(self.axes.text(x, y, label, va='center', fontsize=fontsize))
+        
+        # Surplus labels are removed rather than hidden so they cost nothing to draw
+        for text in pool[len(labels):]:
+            text.remove()
+        del pool[len(labels):]
+        
+    def _update_marker_line(self):
+        """Show the current marker line, if set, as an animated artist.
+        
+        Animated artists are left out of the regular draw, so the cached
+        background never contains the line and it can be moved by blitting.
+        """
+        if not self.current_marker_date:
+            if self._marker_line is not None:
+                self._marker_line.remove()
+                self._marker_line = None
+                self.axes.get_legend().remove()
+            return
         
-        # Format axes
-        self.axes.set_yticks([i * lane_height for i in range(len(self.timelines))])
-        self.axes.set_yticklabels(timeline_names)
-        self.axes.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        self.fig.autofmt_xdate()
+        x = mdates.date2num(self.current_marker_date)
+        if self._marker_line is None:
+            self._marker_line = self.axes.axvline(
+                x, color='red', linestyle='--',
+                linewidth=2, label='Current Point', animated=True)
+            self.axes.legend()
+        else:
+            self._marker_line.set_xdata([x, x])
         
-        self.axes.set_title('Timeline - Swimlane View')
-        self.axes.grid(True, alpha=0.3, axis='x')
+    def _update_limits(self, window: Optional[tuple]):
+        """Fit the axes to the drawn events, or to the zoomed window.
         
-        if self.current_marker_date:
-            self.axes.legend()
+        Artists updated in place don't shrink the data limits, so they are
+        recomputed from the current artists before autoscaling.
+        """
+        self.axes.relim()
+        self.axes.set_autoscale_on(True)
+        if window is not None:
+            self.axes.set_xlim(window)
+        self.axes.autoscale_view()
         
-    def _render_calendar(self, events: List):
+    def _render_calendar(self, mask: np.ndarray):
         """Render calendar view showing events by month."""
-        # Group events by month
-        month_events = {}
-        for event in events:
-            date = self._get_event_date(event)
-            if date:
-                month_key = date.strftime('%Y-%m')
-                if month_key not in month_events:
-                    month_events[month_key] = []
-                month_events[month_key].append(event)
-        
-        # Create bar chart of event counts per month
-        months = sorted(month_events.keys())
-        counts = [len(month_events[m]) for m in months]
-        
-        if months:
-            month_dates = [datetime.strptime(m, '%Y-%m') for m in months]
-            colors = ['steelblue' for _ in months]
-            
-            self.axes.bar(month_dates, counts, width=20, color=colors, alpha=0.7)
-            
+        # Month counts only change with the events or the timeline filter,
+        # so switching back to this view reuses them
+        key = frozenset(self.selected_timeline_ids)
+        if self._calendar_cache is not None and self._calendar_cache[0] == key:
+            month_dates, counts = self._calendar_cache[1:]
+        else:
+            # Count events per month; the months come out of the date order
+            # already ascending, so each month is one run and needs no sort
+            months = self._dates[self._sorted_dated(mask)].astype('datetime64[M]')
+            starts = np.flatnonzero(np.r_[len(months) > 0, months[1:] != months[:-1]])
+            month_dates = months[starts].astype('datetime64[s]')
+            counts = np.diff(np.r_[starts, len(months)])
+            self._calendar_cache = (key, month_dates, counts)
+        
+        # Bar counts and widths are baked into their rectangles, so the
+        # bars are rebuilt while the rest of the axes is kept
+        if self._calendar_bars is not None:
+            self._calendar_bars.remove()
+            self._calendar_bars = None
+        else:
             # Format
-            self.axes.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-            self.fig.autofmt_xdate()
             self.axes.set_ylabel('Number of Events')
             self.axes.set_title('Timeline - Calendar View')
             self.axes.grid(True, alpha=0.3, axis='y')
         
+        if len(month_dates):
+            colors = ['steelblue' for _ in month_dates]
+            
+            self._calendar_bars = self.axes.bar(
+                month_dates, counts, width=np.timedelta64(20, 'D'), color=colors, alpha=0.7)
+        self._update_limits(None)
+        
     def _get_event_date(self, event) -> Optional[datetime]:
         """Extract date from event."""
         if hasattr(event, 'exact_date') and event.exact_date:
@@ -248,23 +571,15 @@ class TimelineCanvas(FigureCanvas):
             return datetime(event.year, 1, 1)
         return None
         
-    def _get_event_color(self, event) -> str:
-        """Get color for event based on type or importance."""
-        # Color mapping for event types
-        type_colors = {
-            'birth': 'green',
-            'death': 'black',
-            'battle': 'red',
-            'meeting': 'blue',
-            'discovery': 'purple',
-            'creation': 'orange',
-            'political': 'darkblue',
-            'cultural': 'pink',
-            'natural': 'brown',
-        }
+    def _type_color(self, event_type: str) -> str:
+        """Get the color for a lowercase event type."""
+        return _TYPE_COLORS.get(event_type, 'gray')
         
-        event_type = getattr(event, 'type', '').lower()
-        return type_colors.get(event_type, 'gray')
+    def _on_draw(self, mpl_event):
+        """Cache the freshly drawn axes, then paint the marker line on top."""
+        self._background = self.copy_from_bbox(self.axes.bbox)
+        if self._marker_line is not None:
+            self.axes.draw_artist(self._marker_line)
         
     def _on_click(self, mpl_event):
         """Handle click on timeline event."""
@@ -281,19 +596,58 @@ class TimelineCanvas(FigureCanvas):
         except:
             return
         
-        closest_event = None
-        min_distance = float('inf')
-        
-        for event in self.events:
-            event_date = self._get_event_date(event)
-            if event_date:
-                distance = abs((event_date - click_date).total_seconds())
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_event = event
+        if not len(self._sorted_dates):
+            return
         
-        if closest_event and min_distance < 86400 * 365:  # Within 1 year
-            self.event_clicked.emit(closest_event)
+        # Binary search the sorted dates; the closest event is one of the
+        # two dates either side of the insertion point
+        click64 = np.datetime64(click_date, 's')
+        i = int(np.searchsorted(self._sorted_dates, click64))
+        candidates = [j for j in (i - 1, i) if 0 <= j < len(self._sorted_dates)]
+        distances = [abs(int((self._sorted_dates[j] - click64).astype(np.int64)))
+                     for j in candidates]
+        best = int(np.argmin(distances))
+        
+        if distances[best] < 86400 * 365:  # Within 1 year
+            self.event_clicked.emit(self.events[self._sorted_idx[candidates[best]]])
+
+
+class _RefreshSignals(QObject):
+    """Signals of _RefreshWorker; a QRunnable can't emit signals itself."""
+    finished = pyqtSignal(int, list, list)  # Refresh number, events, timelines
+    failed = pyqtSignal(int, str)  # Refresh number, error message
+
+
+class _RefreshWorker(QRunnable):
+    """Load a universe's events and timelines on a thread pool thread.
+    
+    SQLAlchemy sessions can't be shared between threads, so the worker opens
+    its own session, queries it through its own services and closes it before
+    handing the rows over; the detached rows keep the column values that were
+    loaded.
+    """
+    
+    def __init__(self, signals: _RefreshSignals, number: int, universe_id, session_factory):
+        super().__init__()
+        self.signals = signals
+        self.number = number
+        self.universe_id = universe_id
+        self.session_factory = session_factory
+    
+    def run(self):
+        session = self.session_factory()
+        try:
+            # The database orders by date, so the canvas sorts presorted input
+            event_service = EventService(EventRepository(session))
+            timeline_service = TimelineService(TimelineRepository(session))
+            events = event_service.get_sorted_by_date(self.universe_id)
+            timelines = timeline_service.get_all_timelines(self.universe_id)
+        except Exception as e:
+            self.signals.failed.emit(self.number, str(e))
+            return
+        finally:
+            session.close()
+        self.signals.finished.emit(self.number, events, timelines)
 
 
 class TimelineWidget(QWidget):
@@ -302,12 +656,30 @@ class TimelineWidget(QWidget):
     """
     event_selected = pyqtSignal(object)  # Emits Event object
     
-    def __init__(self, event_service=None, timeline_service=None, parent=None):
+    def __init__(self, event_service=None, timeline_service=None, parent=None,
+                 session_factory=None):
+        """Initialize the timeline widget.
+        
+        Args:
+            event_service: Service used to load events on the GUI thread
+            timeline_service: Service used to load timelines on the GUI thread
+            parent: Parent widget
+            session_factory: Optional factory for database sessions, e.g. from
+                DatabaseManager.get_worker_session_factory; when given, data is
+                loaded on a worker thread with its own session instead
+        """
         super().__init__(parent)
         self.event_service = event_service
         self.timeline_service = timeline_service
+        self.session_factory = session_factory
         self.current_universe_id = None
         
+        # Results of superseded refreshes are dropped
+        self._refresh_count = 0
+        self._refresh_signals = _RefreshSignals(self)
+        self._refresh_signals.finished.connect(self._on_refresh_finished)
+        self._refresh_signals.failed.connect(self._on_refresh_failed)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -327,8 +699,11 @@ class TimelineWidget(QWidget):
         splitter.addWidget(self.canvas)
         
         # Event list
-        self.event_list = QListWidget()
-        self.event_list.itemDoubleClicked.connect(self._on_event_list_clicked)
+        self.event_model = EventListModel(self)
+        self.event_list = QListView()
+        self.event_list.setModel(self.event_model)
+        self.event_list.setUniformItemSizes(True)
+        self.event_list.doubleClicked.connect(self._on_event_list_clicked)
         splitter.addWidget(self.event_list)
         
         splitter.setStretchFactor(0, 3)
@@ -375,6 +750,13 @@ class TimelineWidget(QWidget):
         refresh_btn.clicked.connect(self.refresh)
         toolbar.addWidget(refresh_btn)
         
+        # Busy indicator while a refresh is loading
+        self.loading_bar = QProgressBar()
+        self.loading_bar.setRange(0, 0)
+        self.loading_bar.setMaximumWidth(100)
+        self.loading_bar.setVisible(False)
+        toolbar.addWidget(self.loading_bar)
+        
         return toolbar
         
     def set_universe(self, universe_id):
@@ -383,53 +765,83 @@ class TimelineWidget(QWidget):
         self.refresh()
         
     def refresh(self):
-        """Refresh timeline data from services."""
+        """Refresh timeline data from services.
+        
+        With a session factory the database is queried on a thread pool
+        thread, so a slow database doesn't freeze the UI, and the views update
+        once the data arrives. The services share the GUI thread's session,
+        so without one they are queried here.
+        """
         if not self.current_universe_id:
             return
         
+        self._refresh_count += 1
+        if self.session_factory is not None:
+            self.loading_bar.setVisible(True)
+            QThreadPool.globalInstance().start(_RefreshWorker(
+                self._refresh_signals, self._refresh_count, self.current_universe_id,
+                self.session_factory))
+            return
+        
         try:
-            # Load events
+            # The database orders by date, so the canvas sorts presorted input
+            events = []
             if self.event_service:
-                events = self.event_service.get_by_universe(self.current_universe_id)
-                # Sort by date
-                events.sort(key=lambda e: e.exact_date or datetime(e.year or 1, 1, 1) 
-                           if hasattr(e, 'exact_date') or hasattr(e, 'year') else datetime.min)
-            else:
-                events = []
+                events = self.event_service.get_sorted_by_date(self.current_universe_id)
             
-            # Load timelines
+            timelines = None
             if self.timeline_service:
-                timelines = self.timeline_service.get_by_universe(self.current_universe_id)
-                # Update timeline combo
-                self.timeline_combo.clear()
-                self.timeline_combo.addItem("All Timelines", None)
-                for timeline in timelines:
-                    self.timeline_combo.addItem(timeline.name, timeline.id)
-            else:
-                timelines = []
+                timelines = self.timeline_service.get_all_timelines(self.current_universe_id)
+        except Exception as e:
+            print(f"Error refreshing timeline: {e}")
+            return
+        self._on_refresh_finished(self._refresh_count, events, timelines)
+        
+    def _on_refresh_finished(self, number: int, events: list, timelines: Optional[list]):
+        """Show the data loaded by a refresh.
+        
+        Args:
+            number: Refresh number; results of superseded refreshes are dropped
+            events: Events in date order
+            timelines: Timelines, or None when there is no timeline source
+        """
+        if number != self._refresh_count:
+            return
+        self.loading_bar.setVisible(False)
+        
+        try:
+            # Update timeline combo; its signals are blocked while it is
+            # repopulated, so the filter is reset once instead of per item
+            if timelines is not None:
+                self.timeline_combo.blockSignals(True)
+                try:
+                    self.timeline_combo.clear()
+                    self.timeline_combo.addItem("All Timelines", None)
+                    for timeline in timelines:
+                        self.timeline_combo.addItem(timeline.name, timeline.id)
+                finally:
+                    self.timeline_combo.blockSignals(False)
+                self.canvas.set_timeline_filter([])
             
             # Update canvas
-            self.canvas.set_events(events, timelines)
+            self.canvas.set_events(events, timelines or [])
             
-            # Update event list
-            self._update_event_list(events)
+            # Update event list, in the date order the canvas already sorted
+            self._update_event_list(self.canvas.sorted_events())
             
         except Exception as e:
             print(f"Error refreshing timeline: {e}")
             
+    def _on_refresh_failed(self, number: int, message: str):
+        """Report a refresh worker that could not load its data."""
+        if number != self._refresh_count:
+            return
+        self.loading_bar.setVisible(False)
+        print(f"Error refreshing timeline: {message}")
+        
     def _update_event_list(self, events):
         """Update the event list widget."""
-        self.event_list.clear()
-        for event in events:
-            date_str = ""
-            if hasattr(event, 'exact_date') and event.exact_date:
-                date_str = event.exact_date.strftime('%Y-%m-%d')
-            elif hasattr(event, 'year') and event.year:
-                date_str = str(event.year)
-            
-            item = QListWidgetItem(f"{date_str} - {event.name}")
-            item.setData(Qt.ItemDataRole.UserRole, event)
-            self.event_list.addItem(item)
+        self.event_model.set_events(events)
             
     def _on_view_changed(self, view_text):
         """Handle view mode change."""
@@ -449,8 +861,8 @@ class TimelineWidget(QWidget):
         else:
             self.canvas.set_timeline_filter([])
             
-    def _on_event_list_clicked(self, item):
+    def _on_event_list_clicked(self, index):
         """Handle event list item click."""
-        event = item.data(Qt.ItemDataRole.UserRole)
+        event = index.data(Qt.ItemDataRole.UserRole)
         if event:
             self.event_selected.emit(event)